@@ -1,11 +1,16 @@
-"""BlizzardAPI — modern Python wrapper for Blizzard's Battle.net API."""
+"""BlizzardAPI — modern Python wrapper for Blizzard's Battle.net API.
+
+Exceptions and types are imported eagerly; they are light. The client and the
+core helpers pull in httpx and every game facade, so they load on first
+attribute access (PEP 562) — scripts that only need ``Region`` or an
+exception class don't pay for them.
+"""
 
 __version__ = "4.1.0"
 
-from .blizzard_api import BlizzardAPI
-from .core.batch import gather_limited
-from .core.cache import ResponseCache
-from .core.executor import ApiResponse
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     AuthenticationError,
     BadRequestError,
@@ -25,6 +30,19 @@ from .exceptions import (
 )
 from .types import ClassicTrack, Locale, Region
 
+if TYPE_CHECKING:
+    from .blizzard_api import BlizzardAPI
+    from .core.batch import gather_limited
+    from .core.cache import ResponseCache
+    from .core.executor import ApiResponse
+
+_LAZY = {
+    "BlizzardAPI": ".blizzard_api",
+    "ApiResponse": ".core.executor",
+    "ResponseCache": ".core.cache",
+    "gather_limited": ".core.batch",
+}
+
 __all__ = [
     "__version__",
     # Core
@@ -53,3 +71,17 @@ __all__ = [
     "TokenExpiredError",
     "ValidationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -21,6 +21,7 @@ Usage::
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from ..core.client import BaseClient
@@ -722,10 +723,14 @@ def _normalize(
     track: ClassicTrack,
     extra: dict[str, Any],
 ) -> tuple[str, dict[str, Any]]:
+    r, namespace, loc = _base_params(region, locale, namespace_type, track)
+    return r, {"namespace": namespace, "locale": loc, **extra}
+
+
+@lru_cache(maxsize=256)
+def _base_params(
+    region: Region | str, locale: Locale | str, namespace_type: str, track: ClassicTrack
+) -> tuple[str, str, str]:
     r = region.value if isinstance(region, Region) else region
     loc = locale.value if isinstance(locale, Locale) else locale
-    return r, {
-        "namespace": f"{namespace_type}-{track.value}-{r}",
-        "locale": loc,
-        **extra,
-    }
+    return r, f"{namespace_type}-{track.value}-{r}", loc
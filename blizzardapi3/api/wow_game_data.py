@@ -5,6 +5,8 @@ Classic is intentionally out of scope here — see :mod:`.wow_classic`.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
+from functools import lru_cache
 from typing import Any
 
 from ..core.client import BaseClient
@@ -48,6 +50,16 @@ class WowGameData:
         r, params = _normalize(region, locale, namespace_type="dynamic", extra=extra)
         return await self._executor.execute_async(region=r, path=path, params=params, client=self._client.async_client)
 
+    def _static_stream(self, region: Region | str, locale: Locale | str, path: str, **extra: Any) -> Iterator[Any]:
+        r, params = _normalize(region, locale, namespace_type="static", extra=extra)
+        return self._executor.stream(region=r, path=path, params=params, client=self._client.sync_client)
+
+    def _static_stream_async(
+        self, region: Region | str, locale: Locale | str, path: str, **extra: Any
+    ) -> AsyncIterator[Any]:
+        r, params = _normalize(region, locale, namespace_type="static", extra=extra)
+        return self._executor.stream_async(region=r, path=path, params=params, client=self._client.async_client)
+
     # ------------------------------------------------------------------
     # Achievement
     # ------------------------------------------------------------------
@@ -428,6 +440,16 @@ class WowGameData:
         """Search for decor items."""
         return await self._static_get_async(region, locale, "/data/wow/search/decor", **filters)
 
+    def search_decor_stream(self, *, region: Region | str, locale: Locale | str, **filters: Any) -> Iterator[Any]:
+        """Search for decor items, yielding each result as it is decoded. Requires the ``stream`` extra."""
+        return self._static_stream(region, locale, "/data/wow/search/decor", **filters)
+
+    def search_decor_stream_async(
+        self, *, region: Region | str, locale: Locale | str, **filters: Any
+    ) -> AsyncIterator[Any]:
+        """Search for decor items, yielding each result as it is decoded. Requires the ``stream`` extra."""
+        return self._static_stream_async(region, locale, "/data/wow/search/decor", **filters)
+
     def get_fixture_index(self, *, region: Region | str, locale: Locale | str) -> ApiResponse:
         """Get an index of fixtures."""
         return self._static_get(region, locale, "/data/wow/fixture/index")
@@ -896,6 +918,16 @@ class WowGameData:
         """Search for mounts."""
         return await self._static_get_async(region, locale, "/data/wow/search/mount", **filters)
 
+    def search_mount_stream(self, *, region: Region | str, locale: Locale | str, **filters: Any) -> Iterator[Any]:
+        """Search for mounts, yielding each result as it is decoded. Requires the ``stream`` extra."""
+        return self._static_stream(region, locale, "/data/wow/search/mount", **filters)
+
+    def search_mount_stream_async(
+        self, *, region: Region | str, locale: Locale | str, **filters: Any
+    ) -> AsyncIterator[Any]:
+        """Search for mounts, yielding each result as it is decoded. Requires the ``stream`` extra."""
+        return self._static_stream_async(region, locale, "/data/wow/search/mount", **filters)
+
     # ------------------------------------------------------------------
     # Mythic Keystone Affix
     # ------------------------------------------------------------------
@@ -1792,6 +1824,13 @@ def _normalize(
     extra: dict[str, Any],
 ) -> tuple[str, dict[str, Any]]:
     """Normalize region/locale to strings and build the query-param dict."""
+    r, namespace, loc = _base_params(region, locale, namespace_type)
+    return r, {"namespace": namespace, "locale": loc, **extra}
+
+
+@lru_cache(maxsize=256)
+def _base_params(region: Region | str, locale: Locale | str, namespace_type: str) -> tuple[str, str, str]:
+    """Memoized ``(region, namespace, locale)`` strings — the same few combos repeat on every call."""
     r = region.value if isinstance(region, Region) else region
     loc = locale.value if isinstance(locale, Locale) else locale
-    return r, {"namespace": f"{namespace_type}-{r}", "locale": loc, **extra}
+    return r, f"{namespace_type}-{r}", loc
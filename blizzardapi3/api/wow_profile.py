@@ -9,6 +9,7 @@ Classic profile endpoints live in :mod:`.wow_classic`.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from ..core.client import BaseClient
@@ -1312,6 +1313,12 @@ def _normalize(
     namespace_type: str,
     extra: dict[str, Any],
 ) -> tuple[str, dict[str, Any]]:
+    r, namespace, loc = _base_params(region, locale, namespace_type)
+    return r, {"namespace": namespace, "locale": loc, **extra}
+
+
+@lru_cache(maxsize=256)
+def _base_params(region: Region | str, locale: Locale | str, namespace_type: str) -> tuple[str, str, str]:
     r = region.value if isinstance(region, Region) else region
     loc = locale.value if isinstance(locale, Locale) else locale
-    return r, {"namespace": f"{namespace_type}-{r}", "locale": loc, **extra}
+    return r, f"{namespace_type}-{r}", loc
@@ -18,13 +18,17 @@ of the underlying httpx sessions::
 
 from __future__ import annotations
 
+import os
+
 from .api.d3 import D3API
 from .api.hearthstone import HearthstoneAPI
 from .api.sc2 import SC2API
 from .api.wow import WowAPI
 from .core.cache import ResponseCache
 from .core.client import BaseClient
+from .core.concurrency import MAX_CONCURRENCY, AdaptiveConcurrencyLimiter, ConcurrencyLimiter
 from .core.executor import RequestExecutor
+from .core.ratelimit import RateLimiter
 
 
 class BlizzardAPI(BaseClient):
@@ -43,13 +47,20 @@ class BlizzardAPI(BaseClient):
         cache: bool = True,
         cache_ttl: int | None = None,
         max_retries: int = 2,
+        rate_limit: bool = True,
+        http2: bool = False,
+        max_concurrency: int | None = MAX_CONCURRENCY,
+        adaptive_concurrency: bool = False,
+        token_cache_dir: str | os.PathLike[str] | None = None,
     ):
         """Construct the API facade.
 
         ``cache`` (default on) enables a response cache that honors Blizzard's
         ``Cache-Control`` headers — static game data (``max-age=86400``) is
-        served from memory until it expires; profile data, which sends no
-        cache directive, is not cached. Set ``cache=False`` to disable.
+        served from memory until it expires. A response with no cache
+        directive (profile data) is stored only if it carries an ``ETag`` or
+        ``Last-Modified``, and is then always revalidated with the server
+        before reuse. Set ``cache=False`` to disable.
 
         ``cache_ttl`` caches responses that carry *no* ``Cache-Control`` (e.g.
         character profiles) for that many seconds — a deliberate
@@ -57,14 +68,56 @@ class BlizzardAPI(BaseClient):
         ``private`` from the server is always honored regardless.
 
         ``max_retries`` bounds automatic retries on transient failures (HTTP
-        429 and 5xx), honoring ``Retry-After`` and otherwise backing off with
-        full jitter. Set to ``0`` to disable and surface the error immediately.
+        429 and 5xx, connection resets, timeouts), honoring ``Retry-After`` and
+        otherwise backing off with full jitter. Set to ``0`` to disable and
+        surface the error immediately.
+
+        ``rate_limit`` (default on) paces outgoing requests to Blizzard's quotas
+        of 100 requests/second and 36,000/hour per region, so bursts wait on the
+        client instead of being rejected with 429. Set ``rate_limit=False`` if
+        you already throttle elsewhere.
+
+        ``http2`` multiplexes concurrent requests to each region host over a
+        single HTTP/2 connection. Requires ``pip install blizzardapi3[http2]``.
+
+        ``max_concurrency`` caps how many async requests this client has on the
+        wire at once, across every ``gather`` and task; the rest wait for a
+        slot. ``None`` removes the cap. Sync calls are not affected.
+
+        ``adaptive_concurrency`` replaces that fixed cap with one that tunes
+        itself. It starts at 4, adds a slot after every 10 consecutive
+        successes up to ``max_concurrency`` (64 if ``None``), and halves on a
+        429. 429s for requests already in flight when it halved are not
+        counted again.
+
+        ``token_cache_dir`` (e.g. ``"~/.cache/blizzardapi3"``) persists the
+        client-credentials token there, so the next process run reuses it
+        instead of requesting a new one. The file is owner-readable only, but
+        it is a live credential — use a private directory.
         """
-        super().__init__(client_id, client_secret, region=region, locale=locale)
+        super().__init__(
+            client_id, client_secret, region=region, locale=locale, http2=http2, token_cache_dir=token_cache_dir
+        )
         self.cache = ResponseCache(default_ttl=cache_ttl) if cache else None
-        executor = RequestExecutor(self.token_manager, cache=self.cache, max_retries=max_retries)
+        executor = RequestExecutor(
+            self.token_manager,
+            cache=self.cache,
+            max_retries=max_retries,
+            rate_limiter=RateLimiter() if rate_limit else None,
+            concurrency=_concurrency_limiter(max_concurrency, adaptive_concurrency),
+        )
 
         self.wow = WowAPI(self, executor)
         self.d3 = D3API(self, executor)
         self.sc2 = SC2API(self, executor)
         self.hearthstone = HearthstoneAPI(self, executor)
+
+
+def _concurrency_limiter(max_concurrency: int | None, adaptive: bool) -> ConcurrencyLimiter | None:
+    if adaptive:
+        return (
+            AdaptiveConcurrencyLimiter()
+            if max_concurrency is None
+            else AdaptiveConcurrencyLimiter(ceiling=max_concurrency)
+        )
+    return ConcurrencyLimiter(max_concurrency) if max_concurrency is not None else None
@@ -1,8 +1,22 @@
-"""Core framework components."""
+"""Core framework components.
 
-from .auth import TokenManager
-from .client import BaseClient
-from .executor import ApiResponse, RequestExecutor
+Loaded lazily (PEP 562) so importing one submodule doesn't import them all.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .auth import TokenManager
+    from .client import BaseClient
+    from .executor import ApiResponse, RequestExecutor
+
+_LAZY = {
+    "ApiResponse": ".executor",
+    "BaseClient": ".client",
+    "RequestExecutor": ".executor",
+    "TokenManager": ".auth",
+}
 
 __all__ = [
     "ApiResponse",
@@ -10,3 +24,17 @@ __all__ = [
     "RequestExecutor",
     "TokenManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
 import time
-from typing import Any
+from pathlib import Path
+from typing import Any, ClassVar
 
 import httpx
 
@@ -18,60 +25,225 @@ class TokenManager:
 
     A single TokenManager is shared across sync and async clients — the
     underlying token is the same regardless of transport.
+
+    A token is *fresh* until ``TOKEN_BUFFER_SECONDS`` before expiry, then
+    *stale* (still accepted by Blizzard) until it actually expires. Stale
+    tokens are refreshed without stalling traffic: async callers get the
+    stale token while a single background task fetches the new one, and
+    sync callers keep using it while another thread holds the refresh lock.
+    Only callers with no usable token wait, and they share one POST.
+
+    Clients obtain their manager through :meth:`shared`, so every client built
+    with the same credentials in one process reuses the same token. China has
+    its own OAuth host and its tokens are not valid elsewhere, so ``region``
+    puts a manager in one of two buckets: ``"cn"`` or everything else.
+
+    With a ``cache_dir`` the token also outlives the process: it is written
+    there after each fetch and read back on first use, so consecutive short
+    script runs skip the OAuth POST until it expires. The file name is a hash
+    of the client id (plus a ``_cn`` suffix for China); writes are atomic and
+    owner-only (0600). The cache is best-effort — any I/O error just means a
+    normal fetch.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    _shared: ClassVar[dict[tuple[str, str, str], TokenManager]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        cache_dir: str | os.PathLike[str] | None = None,
+        *,
+        region: str | None = None,
+    ):
+        self._client_id = client_id
+        self._bucket = _oauth_bucket(region)
         self._basic_auth = httpx.BasicAuth(client_id, client_secret)
         self._token: str | None = None
         self._expires_at: float | None = None
+        self._lock = threading.Lock()
+        self._refresh_task: asyncio.Task[str] | None = None
+        self._cache_file: Path | None = None
+        self._cache_loaded = False
+        if cache_dir is not None:
+            self.set_cache_dir(cache_dir)
+
+    @classmethod
+    def shared(
+        cls,
+        client_id: str,
+        client_secret: str,
+        cache_dir: str | os.PathLike[str] | None = None,
+        *,
+        region: str | None = None,
+    ) -> TokenManager:
+        """Return the process-wide manager for these credentials, creating it on first use.
+
+        Short-lived clients (one per script run, web request or worker job)
+        then skip the client-credentials POST while the token is still valid.
+        A ``cache_dir`` is applied to the shared manager if it has none yet.
+        ``region`` selects the OAuth host: a ``"cn"`` client and a global one
+        with the same credentials get separate managers, since neither
+        token is valid on the other's host.
+        """
+        key = (client_id, client_secret, _oauth_bucket(region))
+        with cls._shared_lock:
+            manager = cls._shared.get(key)
+            if manager is None:
+                manager = cls._shared[key] = cls(client_id, client_secret, region=region)
+            if cache_dir is not None and manager._cache_file is None:
+                manager.set_cache_dir(cache_dir)
+            return manager
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Forget every manager handed out by :meth:`shared`.
+
+        Clients built afterwards get fresh managers, which fetch a new token.
+        Useful after rotating credentials and between tests.
+        """
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    def set_cache_dir(self, cache_dir: str | os.PathLike[str]) -> None:
+        """Persist the token under ``cache_dir`` from now on (see the class docstring)."""
+        digest = hashlib.sha256(self._client_id.encode()).hexdigest()[:32]
+        suffix = "_cn" if self._bucket == "cn" else ""
+        self._cache_file = Path(cache_dir).expanduser() / f"token_{digest}{suffix}.json"
+        self._cache_loaded = False
 
     def is_valid(self) -> bool:
         if self._token is None or self._expires_at is None:
             return False
         return time.time() < (self._expires_at - TOKEN_BUFFER_SECONDS)
 
+    def _is_usable(self) -> bool:
+        """True while the token has not actually expired (fresh or stale)."""
+        return self._token is not None and self._expires_at is not None and time.time() < self._expires_at
+
     def invalidate(self) -> None:
         self._token = None
         self._expires_at = None
 
     def get_token(self, region: str, client: httpx.Client) -> str:
+        if not self._cache_loaded:
+            self._load_cached()
         if self.is_valid():
             return self._token  # type: ignore[return-value]
+        if not self._lock.acquire(blocking=not self._is_usable()):
+            # Stale, and another thread is already refreshing — keep using it.
+            return self._token  # type: ignore[return-value]
+        try:
+            if self.is_valid():  # refreshed by another thread while we waited
+                return self._token  # type: ignore[return-value]
+            url = _oauth_url(region)
+            response = client.post(
+                url,
+                auth=self._basic_auth,
+                data={"grant_type": "client_credentials"},
+                timeout=TOKEN_TIMEOUT,
+            )
+            token = self._store(response, url)
+            self._save()
+            return token
+        finally:
+            self._lock.release()
+
+    async def get_token_async(self, region: str, client: httpx.AsyncClient) -> str:
+        if not self._cache_loaded:
+            # File I/O runs in a worker thread, off the event loop.
+            await asyncio.to_thread(self._load_cached)
+        if self.is_valid():
+            return self._token  # type: ignore[return-value]
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch_async(region, client))
+            task.add_done_callback(self._refresh_done)
+            self._refresh_task = task
+        if self._is_usable():
+            return self._token  # type: ignore[return-value]
+        # Shielded so one cancelled caller doesn't cancel the refresh for the rest.
+        return await asyncio.shield(task)
+
+    async def _fetch_async(self, region: str, client: httpx.AsyncClient) -> str:
         url = _oauth_url(region)
-        response = client.post(
+        response = await client.post(
             url,
             auth=self._basic_auth,
             data={"grant_type": "client_credentials"},
             timeout=TOKEN_TIMEOUT,
         )
-        return self._store(response, url)
+        token = self._store(response, url)
+        if self._cache_file is not None:
+            await asyncio.to_thread(self._save)
+        return token
 
-    async def get_token_async(self, region: str, client: httpx.AsyncClient) -> str:
-        if self.is_valid():
-            return self._token  # type: ignore[return-value]
+    def exchange_authorization_code(
+        self, code: str, redirect_uri: str, region: str, client: httpx.Client
+    ) -> dict[str, Any]:
+        """Trade an OAuth authorization code for a *user* access token.
+
+        Returns Blizzard's token response (``access_token``, ``expires_in``,
+        ``scope``, ...). The user token is not cached here — pass it to
+        profile endpoints as ``access_token=``. Uses the caller's pooled
+        client, so the exchange reuses an open connection to battle.net.
+        """
+        url = _oauth_url(region)
+        response = client.post(
+            url,
+            auth=self._basic_auth,
+            data={"grant_type": "authorization_code", "code": code, "redirect_uri": redirect_uri},
+            timeout=TOKEN_TIMEOUT,
+        )
+        return _token_response(response, url)
+
+    async def exchange_authorization_code_async(
+        self, code: str, redirect_uri: str, region: str, client: httpx.AsyncClient
+    ) -> dict[str, Any]:
+        """Async counterpart of :meth:`exchange_authorization_code`."""
         url = _oauth_url(region)
         response = await client.post(
             url,
             auth=self._basic_auth,
-            data={"grant_type": "client_credentials"},
+            data={"grant_type": "authorization_code", "code": code, "redirect_uri": redirect_uri},
             timeout=TOKEN_TIMEOUT,
         )
-        return self._store(response, url)
+        return _token_response(response, url)
+
+    def _refresh_done(self, task: asyncio.Task[str]) -> None:
+        if self._refresh_task is task:
+            self._refresh_task = None
+        # A failed background refresh is retried by the next caller; retrieve the
+        # exception so asyncio doesn't log it as never retrieved.
+        if not task.cancelled():
+            task.exception()
 
     def _store(self, response: httpx.Response, url: str) -> str:
-        if response.status_code != 200:
-            raise TokenError(
-                f"Failed to obtain token: {response.status_code}",
-                status_code=response.status_code,
-                request_url=url,
-                response_data=_safe_json(response),
-            )
-        data = response.json()
+        data = _token_response(response, url)
         token: str = data["access_token"]
         self._token = token
         self._expires_at = time.time() + data["expires_in"]
         return token
 
+    def _save(self) -> None:
+        """Write the current token to the on-disk cache, if one is configured."""
+        if self._cache_file is not None and self._token is not None and self._expires_at is not None:
+            _write_cached_token(self._cache_file, self._token, self._expires_at)
+
+    def _load_cached(self) -> None:
+        """Adopt the on-disk token once per process, if it is fresher than ours."""
+        if self._cache_file is not None:
+            cached = _read_cached_token(self._cache_file)
+            if cached is not None and cached[1] > (self._expires_at or 0):
+                self._token, self._expires_at = cached
+        self._cache_loaded = True
+
+
+def _oauth_bucket(region: str | None) -> str:
+    """Which OAuth host issues tokens for ``region`` — China's or the global one."""
+    return "cn" if region == "cn" else "global"
+
 
 def _oauth_url(region: str) -> str:
     if region == "cn":
@@ -79,6 +251,41 @@ def _oauth_url(region: str) -> str:
     return f"https://{region}.battle.net/oauth/token"
 
 
+def _token_response(response: httpx.Response, url: str) -> dict[str, Any]:
+    if response.status_code != 200:
+        raise TokenError(
+            f"Failed to obtain token: {response.status_code}",
+            status_code=response.status_code,
+            request_url=url,
+            response_data=_safe_json(response),
+        )
+    return response.json()
+
+
+def _read_cached_token(path: Path) -> tuple[str, float] | None:
+    try:
+        data = json.loads(path.read_text())
+        return str(data["access_token"]), float(data["expires_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_token(path: Path, token: str, expires_at: float) -> None:
+    """Write atomically (temp file + ``os.replace``) so a concurrent reader never sees half a file."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".token-")  # created 0600
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"access_token": token, "expires_at": expires_at}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
 def _safe_json(response: httpx.Response) -> dict[str, Any] | None:
     try:
         return response.json()
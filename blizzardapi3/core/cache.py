@@ -6,10 +6,19 @@ patch. This cache reads that directive and serves the stored response until it
 expires, turning every repeat into a dict lookup instead of an ~80 ms request.
 
 Profile endpoints (character equipment, etc.) send *no* ``Cache-Control`` at
-all, because gear changes. Those are never cached by default. A caller who
+all, because gear changes. Those are never served from memory without asking
+the server first (see the last paragraph). A caller who
 knows their tolerance for staleness can pass ``default_ttl`` to cache them for
 a chosen number of seconds — but an explicit ``no-store``/``no-cache``/
 ``private`` from the server is always obeyed and never overridden.
+
+Expired entries that carry a validator (``ETag`` / ``Last-Modified``) are kept
+rather than dropped. The executor replays those validators as
+``If-None-Match`` / ``If-Modified-Since``; when the server answers
+``304 Not Modified`` the stored response is reused and re-armed, so the body
+is neither downloaded nor parsed again. The same applies to responses that are
+never *fresh* (no ``Cache-Control``, or ``no-cache``) but do carry a
+validator — they are always confirmed with the server before being served.
 """
 
 from __future__ import annotations
@@ -59,6 +68,27 @@ def _max_age(headers: dict[str, str], default: int | None) -> int | None:
     return default
 
 
+def _storable(headers: dict[str, str]) -> bool:
+    """Whether a response may be kept at all — ``no-store``/``private`` forbid it."""
+    cache_control = headers.get("cache-control")
+    if cache_control is None:
+        return True
+    directives = [d.strip().lower() for d in cache_control.split(",")]
+    return not any(d in ("no-store", "private") for d in directives)
+
+
+def _validators(headers: dict[str, str]) -> dict[str, str]:
+    """Conditional-request headers that let the server answer 304 for ``headers``' response."""
+    conditional: dict[str, str] = {}
+    etag = headers.get("etag")
+    if etag:
+        conditional["If-None-Match"] = etag
+    last_modified = headers.get("last-modified")
+    if last_modified:
+        conditional["If-Modified-Since"] = last_modified
+    return conditional
+
+
 class ResponseCache:
     """Thread-safe, bounded, TTL response cache keyed by request identity.
 
@@ -80,18 +110,46 @@ class ResponseCache:
                 return None
             response, expires_at = entry
             if time.monotonic() >= expires_at:
-                del self._store[key]
+                # Stale but revalidatable entries stay for conditional_headers().
+                if not _validators(response.headers):
+                    del self._store[key]
                 return None
             self._store.move_to_end(key)
             return response
 
+    def conditional_headers(self, region: str, path: str, params: dict[str, Any]) -> dict[str, str]:
+        """``If-None-Match`` / ``If-Modified-Since`` for a stored (stale) entry, else ``{}``."""
+        key = _make_key(region, path, params)
+        with self._lock:
+            entry = self._store.get(key)
+        return _validators(entry[0].headers) if entry is not None else {}
+
+    def revalidate(self, region: str, path: str, params: dict[str, Any], headers: dict[str, str]) -> ApiResponse | None:
+        """Re-arm a stored entry after a ``304 Not Modified`` and return it.
+
+        ``headers`` are the 304's own headers; a fresh ``Cache-Control`` there
+        takes precedence over the stored one. Returns ``None`` if the entry was
+        evicted while the conditional request was in flight.
+        """
+        key = _make_key(region, path, params)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            response = entry[0]
+            ttl = _max_age({**response.headers, **headers}, self._default_ttl) or 0
+            self._store[key] = (response, time.monotonic() + ttl)
+            self._store.move_to_end(key)
+            return response
+
     def store(self, region: str, path: str, params: dict[str, Any], response: ApiResponse) -> None:
-        ttl = _max_age(response.headers, self._default_ttl)
-        if ttl is None:
+        headers = response.headers
+        ttl = _max_age(headers, self._default_ttl)
+        if ttl is None and not (_storable(headers) and _validators(headers)):
             return
         key = _make_key(region, path, params)
         with self._lock:
-            self._store[key] = (response, time.monotonic() + ttl)
+            self._store[key] = (response, time.monotonic() + (ttl or 0))
             self._store.move_to_end(key)
             while len(self._store) > self._max_entries:
                 self._store.popitem(last=False)
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Awaitable
-from typing import Self, TypeVar
+from typing import Any, Self, TypeVar
 
 import httpx
 
-from ..types import Locale, Region, get_default_locale
+from ..types import LOCALE_VALUES, Locale, Region, get_default_locale
 from .auth import TokenManager
 from .batch import gather_limited
 
 T = TypeVar("T")
 
+# One connection pool per client, reused by every call for the client's
+# lifetime. httpx's default keeps idle sockets for only 5s, so a pause between
+# bursts of ``asyncio.gather`` fan-out would pay a fresh TCP + TLS handshake to
+# ``{region}.api.blizzard.com`` on the next call. Keep them warm longer, and
+# keep enough of them for a bounded fan-out to reuse rather than reconnect.
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=30, keepalive_expiry=30.0)
+
 
 class BaseClient:
     """Owns the httpx sync/async sessions and the token manager.
 
+    Each session is created lazily and pooled for the client's lifetime, so
+    every ``get_*`` / ``get_*_async`` call shares the same keep-alive
+    connections (see :data:`POOL_LIMITS`). With ``http2=True`` (requires the
+    ``http2`` extra), concurrent requests to a region host are multiplexed as
+    streams over one connection instead of each taking a socket of its own.
+
     Use as a context manager::
 
         with BlizzardAPI(client_id, client_secret) as api:
@@ -31,32 +45,62 @@ class BaseClient:
         client_secret: str,
         region: Region | str = Region.US,
         locale: Locale | str | None = None,
+        http2: bool = False,
+        token_cache_dir: str | os.PathLike[str] | None = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
-        self.default_region = Region(region) if isinstance(region, str) else region
-        self.default_locale = (
-            get_default_locale(self.default_region)
-            if locale is None
-            else (Locale(locale) if isinstance(locale, str) else locale)
+        # Region/Locale are StrEnums, so test for the enum itself to skip re-parsing members.
+        self.default_region = region if isinstance(region, Region) else Region(region)
+        if locale is None:
+            self.default_locale = get_default_locale(self.default_region)
+        elif isinstance(locale, Locale):
+            self.default_locale = locale
+        elif locale in LOCALE_VALUES:
+            self.default_locale = Locale(locale)
+        else:
+            raise ValueError(f"Invalid locale: {locale}")
+
+        self.token_manager = TokenManager.shared(
+            client_id, client_secret, cache_dir=token_cache_dir, region=self.default_region
         )
-
-        self.token_manager = TokenManager(client_id, client_secret)
+        self._http2 = http2
         self._sync_client: httpx.Client | None = None
         self._async_client: httpx.AsyncClient | None = None
 
     @property
     def sync_client(self) -> httpx.Client:
         if self._sync_client is None or self._sync_client.is_closed:
-            self._sync_client = httpx.Client()
+            self._sync_client = httpx.Client(http2=self._http2, limits=POOL_LIMITS)
         return self._sync_client
 
     @property
     def async_client(self) -> httpx.AsyncClient:
         if self._async_client is None or self._async_client.is_closed:
-            self._async_client = httpx.AsyncClient()
+            self._async_client = httpx.AsyncClient(http2=self._http2, limits=POOL_LIMITS)
         return self._async_client
 
+    def exchange_authorization_code(
+        self, code: str, redirect_uri: str, region: Region | str | None = None
+    ) -> dict[str, Any]:
+        """Exchange an OAuth authorization code for a user access token.
+
+        ``redirect_uri`` must match the one used to obtain ``code``. Returns
+        Blizzard's token response; pass its ``access_token`` to profile
+        endpoints. ``region`` defaults to this client's region.
+        """
+        return self.token_manager.exchange_authorization_code(
+            code, redirect_uri, region or self.default_region, self.sync_client
+        )
+
+    async def exchange_authorization_code_async(
+        self, code: str, redirect_uri: str, region: Region | str | None = None
+    ) -> dict[str, Any]:
+        """Async counterpart of :meth:`exchange_authorization_code`."""
+        return await self.token_manager.exchange_authorization_code_async(
+            code, redirect_uri, region or self.default_region, self.async_client
+        )
+
     def close(self) -> None:
         if self._sync_client is not None and not self._sync_client.is_closed:
             self._sync_client.close()
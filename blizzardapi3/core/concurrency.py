@@ -0,0 +1,142 @@
+"""Client-wide cap on in-flight async requests.
+
+:func:`~blizzardapi3.core.batch.gather_limited` bounds one fan-out; nothing
+bounds *all* of them. Several unbounded ``asyncio.gather`` calls (or one over
+hundreds of awaitables) put every request in flight at once. They queue for
+the same few pooled connections, time out behind each other and trip rate
+limits, so throughput drops. The executor holds a slot from this limiter
+for each network request, so excess calls wait their turn instead.
+
+This caps *concurrency*; :class:`~blizzardapi3.core.ratelimit.RateLimiter`
+caps *rate*. Both apply.
+
+A fixed cap is a guess: too low leaves a fast network idle, too high keeps
+hitting 429s. :class:`AdaptiveConcurrencyLimiter` finds the cap instead. It
+grows the limit one slot at a time while requests keep succeeding, and
+halves it on a 429 (additive increase, multiplicative decrease).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+MAX_CONCURRENCY = 20
+ADAPTIVE_INITIAL = 4
+ADAPTIVE_CEILING = 64
+ADAPTIVE_INCREASE_AFTER = 10  # consecutive successes before adding a slot
+LATENCY_SMOOTHING = 0.2  # EWMA weight given to the newest latency sample
+
+
+class ConcurrencyLimiter:
+    """An async semaphore whose limit can change and that works across event loops.
+
+    :class:`asyncio.Semaphore` binds to the first loop that waits on it, but
+    the executor — and so this limiter — outlives any one ``asyncio.run``.
+    Here each waiter is a future of its own loop, and :meth:`set_limit` lets a
+    subclass resize the limit while requests are in flight. Use it from one
+    event loop at a time, like the rest of the async path.
+    """
+
+    def __init__(self, limit: int = MAX_CONCURRENCY):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self._limit = limit
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit. Lowering it never interrupts requests already in flight."""
+        self._limit = max(1, limit)
+        self._wake()
+
+    async def acquire(self) -> None:
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # granted a slot just as we were cancelled — pass it on
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def record(self, status_code: int, started: float, finished: float) -> None:
+        """Observe a request sent at ``started`` and answered at ``finished`` (``time.monotonic()``).
+
+        A fixed limit ignores it; see the adaptive subclass.
+        """
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *_: object) -> None:
+        self.release()
+
+
+class AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """AIMD limit: +1 slot after a run of successes, halved on a 429.
+
+    A burst of 429s from requests that were already in flight when the limit
+    was cut is one overload signal, not many, so only a 429 for a request
+    sent after the last cut halves it again. If the server keeps rejecting,
+    the limit keeps halving.
+
+    Also keeps an exponentially weighted moving average of request latency
+    (:attr:`latency`) for monitoring.
+    """
+
+    def __init__(
+        self,
+        initial: int = ADAPTIVE_INITIAL,
+        ceiling: int = ADAPTIVE_CEILING,
+        increase_after: int = ADAPTIVE_INCREASE_AFTER,
+    ):
+        super().__init__(min(initial, ceiling))
+        self._ceiling = ceiling
+        self._increase_after = increase_after
+        self._streak = 0
+        self._cut_at = float("-inf")  # when the limit was last halved
+        self.latency: float | None = None
+
+    def record(self, status_code: int, started: float, finished: float) -> None:
+        elapsed = finished - started
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += LATENCY_SMOOTHING * (elapsed - self.latency)
+
+        if status_code == 429:
+            self._streak = 0
+            if started >= self._cut_at:  # sent after the last cut, so this is news
+                self._cut_at = finished
+                self.set_limit(self._limit // 2)
+        elif 200 <= status_code < 400:
+            self._streak += 1
+            if self._streak >= self._increase_after:
+                self._streak = 0
+                self.set_limit(min(self._ceiling, self._limit + 1))
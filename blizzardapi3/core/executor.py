@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import random
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, ExitStack, nullcontext
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlencode
 
 import httpx
 
+try:  # optional: several times faster on large bodies such as search results
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 from ..exceptions import (
     BadRequestError,
     ForbiddenError,
@@ -18,21 +29,35 @@ from ..exceptions import (
     ServerError,
 )
 from .auth import TokenManager
-from .cache import ResponseCache
+from .cache import ResponseCache, _make_key
+from .concurrency import ConcurrencyLimiter
+from .ratelimit import RateLimiter
+from .singleflight import SingleFlight
+from .stream import _ijson, aiter_items, iter_items
 
 BASE_URL = "https://{region}.api.blizzard.com"
+_STATIC_PARAMS = frozenset({"namespace", "locale"})  # invariant per session; see _target
 REQUEST_TIMEOUT = 30.0
 MAX_RETRIES = 2  # transient-failure retries (429/5xx), on top of the first attempt
 BACKOFF_BASE = 0.5  # seconds; exponential base for retries lacking a Retry-After
 BACKOFF_CAP = 8.0  # seconds; ceiling for computed (non-Retry-After) backoff
+RETRY_AFTER_CAP = 3600.0  # seconds; longest Retry-After honored (the hourly quota window)
+
+# Connection resets, timeouts and dropped keep-alives: the request may never have
+# reached the server, and GETs are idempotent, so these are retried like a 503.
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
 
 
 class ApiResponse(dict):
     """dict with ``.headers`` and ``.status_code`` attached.
 
     Preserves v3's bracket-access contract while exposing HTTP metadata.
+    One is built per response, so the two attributes live in slots rather
+    than a per-instance ``__dict__``.
     """
 
+    __slots__ = ("_headers", "_status_code")
+
     def __init__(self, data: dict[str, Any], headers: dict[str, str], status_code: int):
         super().__init__(data)
         self._headers = headers
@@ -46,12 +71,32 @@ class ApiResponse(dict):
     def status_code(self) -> int:
         return self._status_code
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slots without __getstate__ can't be pickled under protocols 0 and 1.
+        return (type(self), (dict(self), self._headers, self._status_code))
+
 
 class RequestExecutor:
     """Executes a request with automatic token refresh on 401.
 
-    Sync and async paths are ~15 lines each. All error translation,
+    Sync and async paths mirror each other line for line. All error translation,
     JSON decoding, and retry policy is shared via :func:`_decode`.
+
+    With a :class:`ResponseCache`, a stale entry is revalidated with a
+    conditional GET; a ``304 Not Modified`` returns the stored response
+    without downloading or decoding the body again.
+
+    With a :class:`RateLimiter`, every request that actually goes to the
+    network (retries included, cache hits excluded) first waits for quota.
+    With a :class:`ConcurrencyLimiter`, each async request also holds one of a
+    fixed number of slots while it is on the wire.
+
+    Concurrent identical app-token requests are coalesced by
+    :class:`SingleFlight`: one goes to the network, the rest share its result.
+
+    :meth:`stream` / :meth:`stream_async` decode a large body incrementally
+    instead (see :mod:`.stream`). They skip the cache and coalescing — there
+    is no complete response to store or share.
     """
 
     def __init__(
@@ -59,10 +104,15 @@ class RequestExecutor:
         token_manager: TokenManager,
         cache: ResponseCache | None = None,
         max_retries: int = MAX_RETRIES,
+        rate_limiter: RateLimiter | None = None,
+        concurrency: ConcurrencyLimiter | None = None,
     ):
         self._tokens = token_manager
         self._cache = cache
         self._max_retries = max_retries
+        self._limiter = rate_limiter
+        self._concurrency = concurrency
+        self._inflight = SingleFlight()
 
     def execute(
         self,
@@ -72,30 +122,210 @@ class RequestExecutor:
         params: dict[str, Any],
         client: httpx.Client,
     ) -> ApiResponse:
-        url = f"{BASE_URL.format(region=region)}{path}"
+        url = f"{_base_url(region)}{path}"
         user_token = params.pop("access_token", None)
 
-        # User-token requests bypass the cache entirely: their responses may be
-        # caller-scoped, so they must never be stored under a shared key nor
-        # served to a different caller.
-        cache = self._cache if user_token is None else None
-        if cache is not None:
-            cached = cache.get(region, path, params)
+        # User-token requests bypass the cache and coalescing entirely: their
+        # responses may be caller-scoped, so they must never be stored under a
+        # shared key nor served to a different caller.
+        if user_token is not None:
+            return self._fetch(client, region, path, url, params, user_token)
+
+        if self._cache is not None:
+            cached = self._cache.get(region, path, params)
             if cached is not None:
                 return cached
 
+        return self._inflight.do(
+            _make_key(region, path, params),
+            lambda: self._fetch(client, region, path, url, params, None),
+        )
+
+    async def execute_async(
+        self,
+        *,
+        region: str,
+        path: str,
+        params: dict[str, Any],
+        client: httpx.AsyncClient,
+    ) -> ApiResponse:
+        url = f"{_base_url(region)}{path}"
+        user_token = params.pop("access_token", None)
+
+        if user_token is not None:
+            return await self._fetch_async(client, region, path, url, params, user_token)
+
+        if self._cache is not None:
+            cached = self._cache.get(region, path, params)
+            if cached is not None:
+                return cached
+
+        return await self._inflight.do_async(
+            _make_key(region, path, params),
+            lambda: self._fetch_async(client, region, path, url, params, None),
+        )
+
+    def stream(
+        self,
+        *,
+        region: str,
+        path: str,
+        params: dict[str, Any],
+        client: httpx.Client,
+        prefix: str = "results.item",
+    ) -> Iterator[Any]:
+        """Yield the JSON values at ``prefix`` while the response body downloads.
+
+        HTTP errors raise before the first item, exactly as :meth:`execute`
+        would, and connection errors while opening the stream are retried the
+        same way. Once items have been yielded, a dropped connection raises
+        rather than restarting the stream. Breaking out of the loop closes the
+        connection.
+        """
+        _ijson()  # fail on a missing extra before spending a request
+        url = f"{_base_url(region)}{path}"
+        user_token = params.pop("access_token", None)
         token = user_token or self._tokens.get_token(region, client)
+        target = _target(url, params)
+        refreshed = False
+        attempt = 0
+
+        while True:
+            if self._limiter is not None:
+                self._limiter.acquire(region)
+            with ExitStack() as stack:
+                try:
+                    response = stack.enter_context(
+                        client.stream("GET", target, headers=_auth(token), timeout=REQUEST_TIMEOUT)
+                    )
+                    if response.status_code != 200:
+                        response.read()
+                except _TRANSIENT_ERRORS:
+                    if attempt >= self._max_retries:
+                        raise
+                    time.sleep(_backoff(attempt))
+                    attempt += 1
+                    continue
+                if response.status_code == 200:
+                    yield from iter_items(response.iter_bytes(), prefix)
+                    return
+
+            if response.status_code == 401 and not user_token and not refreshed:
+                refreshed = True
+                self._tokens.invalidate()
+                token = self._tokens.get_token(region, client)
+                continue
+            if attempt < self._max_retries and _is_retryable(response.status_code):
+                time.sleep(_retry_delay(response, attempt))
+                attempt += 1
+                continue
+            _decode(response, url)  # raises for every non-200 status
 
-        for attempt in range(self._max_retries + 1):
-            response = client.get(url, params=params, headers=_auth(token), timeout=REQUEST_TIMEOUT)
+    async def stream_async(
+        self,
+        *,
+        region: str,
+        path: str,
+        params: dict[str, Any],
+        client: httpx.AsyncClient,
+        prefix: str = "results.item",
+    ) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`stream`.
+
+        The concurrency slot covers sending the request and receiving the
+        status line only — it is released before the first item is yielded, so
+        calls made inside the ``async for`` body never wait on the stream's own
+        slot.
+        """
+        _ijson()  # fail on a missing extra before spending a request
+        url = f"{_base_url(region)}{path}"
+        user_token = params.pop("access_token", None)
+        token = user_token or await self._tokens.get_token_async(region, client)
+        target = _target(url, params)
+        refreshed = False
+        attempt = 0
+
+        while True:
+            async with AsyncExitStack() as stack:
+                try:
+                    async with self._concurrency or nullcontext():
+                        if self._limiter is not None:
+                            await self._limiter.acquire_async(region)
+                        started = time.monotonic()
+                        response = await stack.enter_async_context(
+                            client.stream("GET", target, headers=_auth(token), timeout=REQUEST_TIMEOUT)
+                        )
+                        if self._concurrency is not None:
+                            self._concurrency.record(response.status_code, started, time.monotonic())
+                        if response.status_code != 200:
+                            await response.aread()
+                except _TRANSIENT_ERRORS:
+                    if attempt >= self._max_retries:
+                        raise
+                    await asyncio.sleep(_backoff(attempt))
+                    attempt += 1
+                    continue
+                if response.status_code == 200:
+                    async for item in aiter_items(response.aiter_bytes(), prefix):
+                        yield item
+                    return
+
+            if response.status_code == 401 and not user_token and not refreshed:
+                refreshed = True
+                self._tokens.invalidate()
+                token = await self._tokens.get_token_async(region, client)
+                continue
+            if attempt < self._max_retries and _is_retryable(response.status_code):
+                await asyncio.sleep(_retry_delay(response, attempt))
+                attempt += 1
+                continue
+            _decode(response, url)  # raises for every non-200 status
 
-            if response.status_code == 401 and not user_token:
+    def _fetch(
+        self,
+        client: httpx.Client,
+        region: str,
+        path: str,
+        url: str,
+        params: dict[str, Any],
+        user_token: str | None,
+    ) -> ApiResponse:
+        cache = self._cache if user_token is None else None
+        token = user_token or self._tokens.get_token(region, client)
+        conditional = cache.conditional_headers(region, path, params) if cache is not None else {}
+
+        refreshed = False
+        attempt = 0
+
+        # Every send goes through the one guarded call below: a token refresh
+        # or a cache eviction just adjusts the headers and goes round again.
+        while True:
+            try:
+                response = self._send(client, region, url, params, {**_auth(token), **conditional})
+            except _TRANSIENT_ERRORS:
+                if attempt >= self._max_retries:
+                    raise
+                time.sleep(_backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code == 401 and not user_token and not refreshed:
+                refreshed = True
                 self._tokens.invalidate()
                 token = self._tokens.get_token(region, client)
-                response = client.get(url, params=params, headers=_auth(token), timeout=REQUEST_TIMEOUT)
+                continue
+
+            if response.status_code == 304 and cache is not None and conditional:
+                revalidated = cache.revalidate(region, path, params, dict(response.headers))
+                if revalidated is not None:
+                    return revalidated
+                # Evicted while the conditional request was in flight — fetch it in full.
+                conditional = {}
+                continue
 
             if attempt < self._max_retries and _is_retryable(response.status_code):
                 time.sleep(_retry_delay(response, attempt))
+                attempt += 1
                 continue
 
             result = _decode(response, url)
@@ -103,37 +333,51 @@ class RequestExecutor:
                 cache.store(region, path, params, result)
             return result
 
-        raise RuntimeError("unreachable: retry loop always returns or raises")
-
-    async def execute_async(
+    async def _fetch_async(
         self,
-        *,
+        client: httpx.AsyncClient,
         region: str,
         path: str,
+        url: str,
         params: dict[str, Any],
-        client: httpx.AsyncClient,
+        user_token: str | None,
     ) -> ApiResponse:
-        url = f"{BASE_URL.format(region=region)}{path}"
-        user_token = params.pop("access_token", None)
-
         cache = self._cache if user_token is None else None
-        if cache is not None:
-            cached = cache.get(region, path, params)
-            if cached is not None:
-                return cached
-
         token = user_token or await self._tokens.get_token_async(region, client)
+        conditional = cache.conditional_headers(region, path, params) if cache is not None else {}
+
+        refreshed = False
+        attempt = 0
+
+        # Every send goes through the one guarded call below: a token refresh
+        # or a cache eviction just adjusts the headers and goes round again.
+        while True:
+            try:
+                response = await self._send_async(client, region, url, params, {**_auth(token), **conditional})
+            except _TRANSIENT_ERRORS:
+                if attempt >= self._max_retries:
+                    raise
+                await asyncio.sleep(_backoff(attempt))
+                attempt += 1
+                continue
 
-        for attempt in range(self._max_retries + 1):
-            response = await client.get(url, params=params, headers=_auth(token), timeout=REQUEST_TIMEOUT)
-
-            if response.status_code == 401 and not user_token:
+            if response.status_code == 401 and not user_token and not refreshed:
+                refreshed = True
                 self._tokens.invalidate()
                 token = await self._tokens.get_token_async(region, client)
-                response = await client.get(url, params=params, headers=_auth(token), timeout=REQUEST_TIMEOUT)
+                continue
+
+            if response.status_code == 304 and cache is not None and conditional:
+                revalidated = cache.revalidate(region, path, params, dict(response.headers))
+                if revalidated is not None:
+                    return revalidated
+                # Evicted while the conditional request was in flight — fetch it in full.
+                conditional = {}
+                continue
 
             if attempt < self._max_retries and _is_retryable(response.status_code):
                 await asyncio.sleep(_retry_delay(response, attempt))
+                attempt += 1
                 continue
 
             result = _decode(response, url)
@@ -141,7 +385,51 @@ class RequestExecutor:
                 cache.store(region, path, params, result)
             return result
 
-        raise RuntimeError("unreachable: retry loop always returns or raises")
+    def _send(
+        self, client: httpx.Client, region: str, url: str, params: dict[str, Any], headers: dict[str, str]
+    ) -> httpx.Response:
+        if self._limiter is not None:
+            self._limiter.acquire(region)
+        return client.get(_target(url, params), headers=headers, timeout=REQUEST_TIMEOUT)
+
+    async def _send_async(
+        self, client: httpx.AsyncClient, region: str, url: str, params: dict[str, Any], headers: dict[str, str]
+    ) -> httpx.Response:
+        async with self._concurrency or nullcontext():
+            if self._limiter is not None:
+                await self._limiter.acquire_async(region)
+            started = time.monotonic()
+            response = await client.get(_target(url, params), headers=headers, timeout=REQUEST_TIMEOUT)
+            if self._concurrency is not None:
+                self._concurrency.record(response.status_code, started, time.monotonic())
+            return response
+
+
+@lru_cache(maxsize=8)
+def _base_url(region: str) -> str:
+    return BASE_URL.format(region=region)
+
+
+def _target(url: str, params: dict[str, Any]) -> str:
+    """``url`` with its query string, reusing the pre-encoded ``namespace``/``locale`` prefix.
+
+    Those two are the same on nearly every request of a session, so their
+    encoded form is memoized by :func:`_static_query`; only the
+    request-specific filters are encoded per call (by httpx's own rules).
+    """
+    namespace, locale = params.get("namespace"), params.get("locale")
+    if not isinstance(namespace, str | None) or not isinstance(locale, str):
+        return f"{url}?{httpx.QueryParams(params)}" if params else url
+    query = _static_query(namespace, locale)
+    rest = {k: v for k, v in params.items() if k not in _STATIC_PARAMS}
+    return f"{url}?{query}&{httpx.QueryParams(rest)}" if rest else f"{url}?{query}"
+
+
+@lru_cache(maxsize=256)
+def _static_query(namespace: str | None, locale: str) -> str:
+    if namespace is None:
+        return urlencode({"locale": locale})
+    return urlencode({"namespace": namespace, "locale": locale})
 
 
 def _auth(token: str) -> dict[str, str]:
@@ -158,30 +446,55 @@ def _retry_delay(response: httpx.Response, attempt: int) -> float:
 
     A ``Retry-After`` (sent on 429) is authoritative — the server is telling us
     exactly when to come back, so we honor it. Otherwise we use full-jitter
-    exponential backoff: ``random(0, min(cap, base * 2**attempt))``. The jitter
-    spreads a fleet of concurrent callers out instead of having them all retry
-    on the same beat (the thundering-herd problem).
+    exponential backoff (see :func:`_backoff`).
     """
-    retry_after = response.headers.get("retry-after")
+    retry_after = _parse_retry_after(response.headers.get("retry-after"))
     if retry_after is not None:
-        try:
-            return max(0.0, float(retry_after))
-        except ValueError:
-            pass
+        return retry_after
+    return _backoff(attempt)
+
+
+def _backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff: ``random(0, min(cap, base * 2**attempt))``.
+
+    The jitter spreads a fleet of concurrent callers out instead of having them
+    all retry on the same beat (the thundering-herd problem).
+    """
     return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds from now named by a ``Retry-After`` — delta-seconds or an HTTP-date.
+
+    Delta-seconds must be a non-negative integer (RFC 9110), so ``inf``,
+    ``1e400`` and ``-5`` are malformed. Either form is capped at
+    :data:`RETRY_AFTER_CAP`.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        # Check the length before converting: a huge digit string exceeds int()'s limit.
+        digits = value.lstrip("0") or "0"
+        return RETRY_AFTER_CAP if len(digits) > 9 else min(float(digits), RETRY_AFTER_CAP)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return min(RETRY_AFTER_CAP, max(0.0, when.timestamp() - time.time()))
+
+
 def _decode(response: httpx.Response, url: str) -> ApiResponse:
     """Turn an ``httpx.Response`` into :class:`ApiResponse` or raise an error.
 
-    Works for both sync and async — ``httpx.Response.json()`` is synchronous
-    in both transports.
+    Works for both sync and async — the body has already been read in both
+    transports. Parses the raw bytes with ``orjson`` when it is installed.
     """
     if response.status_code == 200:
-        return ApiResponse(response.json(), dict(response.headers), 200)
+        return ApiResponse(_loads(response.content), dict(response.headers), 200)
 
     try:
-        body = response.json()
+        body = _loads(response.content)
     except ValueError:
         body = None
 
@@ -194,12 +507,12 @@ def _decode(response: httpx.Response, url: str) -> ApiResponse:
         case 404:
             raise NotFoundError("Not found", status_code=404, request_url=url, response_data=body)
         case 429:
-            retry_after = response.headers.get("Retry-After")
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
             raise RateLimitError(
                 "Rate limit exceeded",
                 status_code=429,
                 request_url=url,
-                retry_after=int(retry_after) if retry_after else None,
+                retry_after=math.ceil(retry_after) if retry_after is not None else None,
                 response_data=body,
             )
         case _ if 500 <= status < 600:
@@ -0,0 +1,81 @@
+"""Client-side rate limiting against Blizzard's published quotas.
+
+Blizzard allows each API client 100 requests per second and 36,000 per hour.
+Exceed either and the server answers 429 — a wasted round-trip that still
+counts against the quota, followed by a ``Retry-After`` wait. Pacing requests
+on the client instead means a burst (a large ``gather``, a tight search loop)
+is smoothed out before it leaves the process and never gets rejected.
+
+Each quota is a token bucket. The hourly one is simply a bucket that holds
+36,000 tokens and refills at 10/s, so a cold client may burst until the hour's
+budget is spent and is then held to the sustainable rate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+PER_SECOND = 100
+PER_HOUR = 36_000
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from both sync and async code.
+
+    Tokens are *reserved*: the balance may go negative, and each caller sleeps
+    for its own share of the deficit. Waiters therefore queue in arrival order
+    without a condition variable, and one bucket serves both transports.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+class RateLimiter:
+    """Per-region pair of buckets enforcing the per-second and per-hour quotas."""
+
+    def __init__(self, per_second: int = PER_SECOND, per_hour: int = PER_HOUR):
+        self._per_second = per_second
+        self._per_hour = per_hour
+        self._buckets: dict[str, tuple[TokenBucket, TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, region: str) -> float:
+        buckets = self._buckets.get(region)
+        if buckets is None:
+            with self._lock:
+                buckets = self._buckets.setdefault(
+                    region,
+                    (
+                        TokenBucket(self._per_second, self._per_second),
+                        TokenBucket(self._per_hour / 3600, self._per_hour),
+                    ),
+                )
+        return max(bucket.reserve() for bucket in buckets)
+
+    def acquire(self, region: str) -> None:
+        """Block until a request to ``region`` is within quota."""
+        delay = self._reserve(region)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, region: str) -> None:
+        """Wait (without blocking the loop) until a request to ``region`` is within quota."""
+        delay = self._reserve(region)
+        if delay > 0:
+            await asyncio.sleep(delay)
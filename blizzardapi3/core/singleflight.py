@@ -0,0 +1,71 @@
+"""Request coalescing — one network call for many identical concurrent requests.
+
+A fan-out such as ``asyncio.gather`` over a list with repeats (the same item,
+realm or achievement looked up by several tasks) would otherwise send every
+duplicate to Blizzard, spending quota on answers that are byte-for-byte the
+same. While a request is in flight, later callers with the same key wait on
+it instead of issuing their own, and all of them receive its result (or its
+exception).
+
+This complements :class:`~blizzardapi3.core.cache.ResponseCache`: the cache
+covers repeats *after* a response arrives, single-flight covers repeats that
+arrive *before* it does — including responses the cache may not store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls by key, for threads and for coroutines."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn()`` unless a call for ``key`` is already running; then share its outcome."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` unless a call for ``key`` is already in flight; then share its outcome."""
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._tasks[key] = task
+        # Shielded so one cancelled caller doesn't cancel the request for the rest.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the exception retrieved even if every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,53 @@
+"""Incremental JSON decoding for large responses.
+
+A search page can run to megabytes, yet callers often look at only the first
+few results. Decoding the whole body up front means downloading and parsing
+all of it before the first item is available. Here the body is fed to
+`ijson <https://github.com/ICRAR/ijson>`_ chunk by chunk as it arrives, and
+each element under ``prefix`` is yielded as soon as it is complete. A caller
+that stops early stops the download, and memory stays bounded by one item
+rather than one page.
+
+``ijson`` is optional — install the ``stream`` extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+
+def iter_items(chunks: Iterable[bytes], prefix: str) -> Iterator[Any]:
+    """Yield each JSON value at ``prefix`` (ijson syntax, e.g. ``"results.item"``) from byte chunks."""
+    ijson = _ijson()
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from items
+        del items[:]
+    parser.close()
+    yield from items
+
+
+async def aiter_items(chunks: AsyncIterable[bytes], prefix: str) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`iter_items`."""
+    ijson = _ijson()
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    async for chunk in chunks:
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
+
+
+def _ijson() -> Any:
+    try:
+        import ijson
+    except ImportError:
+        raise ImportError("Streaming responses requires ijson: pip install 'blizzardapi3[stream]'") from None
+    return ijson
@@ -24,17 +24,14 @@ class TokenError(AuthenticationError):
     token_type: str | None = None
     expires_in: int | None = None
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format token error message."""
-        parts = [f"TokenError: {self.message}"]
-
+        msg = f"TokenError: {self.message}"
         if self.status_code:
-            parts.append(f"Status: {self.status_code}")
-
+            msg += f" | Status: {self.status_code}"
         if self.token_type:
-            parts.append(f"Token Type: {self.token_type}")
-
-        return " | ".join(parts)
+            msg += f" | Token Type: {self.token_type}"
+        return msg
 
 
 @dataclass(slots=True)
@@ -54,11 +51,9 @@ class TokenExpiredError(AuthenticationError):
 
     expired_at: int | None = None
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format token expiration error."""
-        parts = [f"TokenExpiredError: {self.message}"]
-
+        msg = f"TokenExpiredError: {self.message}"
         if self.expired_at:
-            parts.append(f"Expired at: {self.expired_at}")
-
-        return " | ".join(parts)
+            msg += f" | Expired at: {self.expired_at}"
+        return msg
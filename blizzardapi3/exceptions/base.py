@@ -4,10 +4,19 @@ from dataclasses import dataclass
 from typing import Any
 
 
+class _CachedStrError(Exception):
+    """Holds the formatted-message cache in a slot that is not a dataclass field."""
+
+    __slots__ = ("_str",)
+
+
 @dataclass(slots=True)
-class BlizzardAPIError(Exception):
+class BlizzardAPIError(_CachedStrError):
     """Base exception for all Blizzard API errors.
 
+    Treat instances as immutable: the message is formatted on the first
+    ``str()`` and reused, so later changes to the fields do not show up in it.
+
     Attributes:
         message: Error message describing what went wrong
         status_code: HTTP status code if applicable
@@ -21,13 +30,18 @@ class BlizzardAPIError(Exception):
     response_data: dict[str, Any] | None = None
 
     def __str__(self) -> str:
+        """Return the formatted message, built once by :meth:`_format` and cached."""
+        try:
+            return self._str
+        except AttributeError:
+            self._str = self._format()
+            return self._str
+
+    def _format(self) -> str:
         """Format error message with context."""
-        parts = [f"BlizzardAPIError: {self.message}"]
-
+        msg = f"BlizzardAPIError: {self.message}"
         if self.status_code:
-            parts.append(f"Status: {self.status_code}")
-
+            msg += f" | Status: {self.status_code}"
         if self.request_url:
-            parts.append(f"URL: {self.request_url}")
-
-        return " | ".join(parts)
+            msg += f" | URL: {self.request_url}"
+        return msg
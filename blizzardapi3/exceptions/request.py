@@ -40,7 +40,7 @@ class RateLimitError(RequestError):
     The client has sent too many requests in a given timeframe.
     """
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format rate limit error message."""
         msg = f"RateLimitError: {self.message}"
         if self.retry_after:
@@ -18,17 +18,14 @@ class ValidationError(BlizzardAPIError):
     field: str | None = None
     invalid_value: Any | None = None
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format validation error message."""
-        parts = [f"ValidationError: {self.message}"]
-
+        msg = f"ValidationError: {self.message}"
         if self.field:
-            parts.append(f"Field: {self.field}")
-
+            msg += f" | Field: {self.field}"
         if self.invalid_value is not None:
-            parts.append(f"Invalid value: {self.invalid_value}")
-
-        return " | ".join(parts)
+            msg += f" | Invalid value: {self.invalid_value}"
+        return msg
 
 
 @dataclass(slots=True)
@@ -41,9 +38,9 @@ class InvalidRegionError(ValidationError):
 
     valid_regions: list[str] | None = None
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format invalid region error."""
-        msg = ValidationError.__str__(self)
+        msg = ValidationError._format(self)
         if self.valid_regions:
             msg += f" | Valid regions: {', '.join(self.valid_regions)}"
         return msg
@@ -59,9 +56,9 @@ class InvalidLocaleError(ValidationError):
 
     valid_locales: list[str] | None = None
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format invalid locale error."""
-        msg = ValidationError.__str__(self)
+        msg = ValidationError._format(self)
         if self.valid_locales:
             msg += f" | Valid locales: {', '.join(self.valid_locales)}"
         return msg
@@ -77,9 +74,9 @@ class MissingParameterError(ValidationError):
 
     required_params: list[str] | None = None
 
-    def __str__(self) -> str:
+    def _format(self) -> str:
         """Format missing parameter error."""
-        msg = ValidationError.__str__(self)
+        msg = ValidationError._format(self)
         if self.required_params:
             msg += f" | Required: {', '.join(self.required_params)}"
         return msg
@@ -62,6 +62,10 @@ class Locale(StrEnum):
     ZH_CN = "zh_CN"
 
 
+# Raw values, for O(1) validation of plain strings without building enum members
+REGION_VALUES: frozenset[str] = frozenset(r.value for r in Region)
+LOCALE_VALUES: frozenset[str] = frozenset(loc.value for loc in Locale)
+
 # Mapping of regions to their default locales
 REGION_LOCALES: dict[Region, list[Locale]] = {
     Region.US: [Locale.EN_US, Locale.ES_MX, Locale.PT_BR],
@@ -84,11 +88,10 @@ def get_default_locale(region: Region | str) -> Locale:
     Raises:
         ValueError: If the region is invalid
     """
-    if isinstance(region, str):
-        try:
-            region = Region(region)
-        except ValueError:
+    if not isinstance(region, Region):
+        if region not in REGION_VALUES:
             raise ValueError(f"Invalid region: {region}")
+        region = Region(region)
 
     locales = REGION_LOCALES.get(region)
     if not locales:
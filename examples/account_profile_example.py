@@ -9,12 +9,28 @@ Prerequisites:
 """
 
 import os
+from operator import itemgetter
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 from blizzardapi3 import BlizzardAPI, Locale, Region
 
+character_fields = itemgetter("name", "level", "playable_class", "realm")
+
+
+def character_line(char):
+    """Format one character as a summary line."""
+    try:
+        name, level, char_class, realm = character_fields(char)
+        char_class, realm = char_class["name"], realm["name"]
+    except KeyError:  # incomplete record — fall back field by field
+        name = char.get("name", "Unknown")
+        level = char.get("level", "?")
+        char_class = char.get("playable_class", {}).get("name", "Unknown")
+        realm = char.get("realm", {}).get("name", "Unknown")
+    return f"      - {name} (Level {level} {char_class} on {realm})"
+
 
 def main():
     """Fetch and display account profile information."""
@@ -59,16 +75,13 @@ def main():
                     print(f"    ID: {wow_account['id']}")
 
                     if "characters" in wow_account:
-                        char_count = len(wow_account["characters"])
+                        characters = wow_account["characters"]
+                        char_count = len(characters)
                         print(f"    Characters: {char_count}")
 
-                        # Show sample characters
-                        for char in wow_account["characters"][:5]:
-                            realm = char.get("realm", {}).get("name", "Unknown")
-                            level = char.get("level", "?")
-                            char_class = char.get("playable_class", {}).get("name", "Unknown")
-                            name = char.get("name", "Unknown")
-                            print(f"      - {name} (Level {level} {char_class} on {realm})")
+                        # Show sample characters, written in one go
+                        if characters:
+                            print("\n".join(map(character_line, characters[:5])))
 
                         if char_count > 5:
                             print(f"      ... and {char_count - 5} more")
@@ -5,11 +5,14 @@ WoW Profile API. No OAuth token required for public character data.
 """
 
 import os
+from operator import itemgetter
 
 from dotenv import load_dotenv
 
 from blizzardapi3 import BlizzardAPI, Locale, Region
 
+item_fields = itemgetter("slot", "name", "quality")
+
 
 def main():
     """Fetch and display character profile information."""
@@ -54,15 +57,17 @@ def main():
             region=Region.US, locale=Locale.EN_US, realm_slug=realm, character_name=character
         )
 
-        for item in equipment["equipped_items"][:5]:  # Show first 5 items
-            slot = item["slot"]["name"]
-            name = item["name"]
-            quality = item["quality"]["name"]
-            level = item.get("level", {}).get("value", "N/A")
-            print(f"  {slot}: {name} ({quality}, ilvl {level})")
-
-        if len(equipment["equipped_items"]) > 5:
-            print(f"  ... and {len(equipment['equipped_items']) - 5} more items")
+        equipped_items = equipment["equipped_items"]
+        for item in equipped_items[:5]:  # Show first 5 items
+            slot, name, quality = item_fields(item)
+            try:
+                level = item["level"]["value"]
+            except KeyError:
+                level = "N/A"
+            print(f"  {slot['name']}: {name} ({quality['name']}, ilvl {level})")
+
+        if len(equipped_items) > 5:
+            print(f"  ... and {len(equipped_items) - 5} more items")
 
 
 if __name__ == "__main__":
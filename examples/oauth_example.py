@@ -16,17 +16,18 @@ import sys
 from pathlib import Path
 from urllib.parse import urlencode
 
-import requests
 from dotenv import load_dotenv
 
+from blizzardapi3 import BlizzardAPI
+
+REDIRECT_URI = "https://community.developer.battle.net/"
+
 
 def generate_auth_url(client_id, region="us"):
     """Generate OAuth authorization URL."""
-    redirect_uri = "https://community.developer.battle.net/"
-
     auth_params = {
         "client_id": client_id,
-        "redirect_uri": redirect_uri,
+        "redirect_uri": REDIRECT_URI,
         "response_type": "code",
         "scope": "wow.profile",
     }
@@ -37,21 +38,8 @@ def generate_auth_url(client_id, region="us"):
 
 def exchange_code_for_token(code, client_id, client_secret, region="us"):
     """Exchange authorization code for access token."""
-    redirect_uri = "https://community.developer.battle.net/"
-    token_url = f"https://{region}.battle.net/oauth/token"
-
-    token_data = {
-        "grant_type": "authorization_code",
-        "code": code,
-        "redirect_uri": redirect_uri,
-    }
-
-    response = requests.post(token_url, auth=(client_id, client_secret), data=token_data, timeout=10)
-
-    if response.status_code != 200:
-        raise Exception(f"Token request failed ({response.status_code}): {response.text}")
-
-    return response.json()
+    with BlizzardAPI(client_id, client_secret, region=region) as api:
+        return api.exchange_authorization_code(code, REDIRECT_URI)
 
 
 def main():
@@ -63,6 +63,12 @@ def test_api_initialization(mock_credentials):
     assert api.default_locale == Locale.EN_US
 
 
+def test_api_initialization_with_string_locale(mock_credentials):
+    assert BlizzardAPI(**mock_credentials, region="eu", locale="de_DE").default_locale == Locale.DE_DE
+    with pytest.raises(ValueError, match="Invalid locale: xx_XX"):
+        BlizzardAPI(**mock_credentials, locale="xx_XX")
+
+
 def test_sub_apis_are_wired(api_client):
     assert hasattr(api_client, "wow")
     assert hasattr(api_client.wow, "game_data")
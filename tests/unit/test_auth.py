@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import time
 
 import httpx
@@ -83,3 +85,190 @@ async def test_get_token_async_raises_on_non_200():
     async with httpx.AsyncClient(transport=transport) as client:
         with pytest.raises(TokenError):
             await tm.get_token_async("us", client)
+
+
+# ---------------------------------------------------------------------------
+# Stale-while-revalidate refresh
+# ---------------------------------------------------------------------------
+
+
+def _counting_transport(requests: list[httpx.Request], token: str = "fresh") -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"access_token": token, "expires_in": 86400})
+
+    return httpx.MockTransport(handler)
+
+
+def _stale(tm: TokenManager, token: str = "stale") -> None:
+    """Put ``tm`` inside the refresh buffer: no longer fresh, but not yet expired."""
+    tm._token = token
+    tm._expires_at = time.time() + TOKEN_BUFFER_SECONDS - 10
+
+
+@pytest.mark.asyncio
+async def test_get_token_async_serves_stale_token_while_refreshing():
+    tm = TokenManager("id", "secret")
+    _stale(tm)
+    requests: list[httpx.Request] = []
+    async with httpx.AsyncClient(transport=_counting_transport(requests)) as client:
+        assert await tm.get_token_async("us", client) == "stale"
+        assert await tm.get_token_async("us", client) == "stale"  # joins the in-flight refresh
+        await tm._refresh_task
+        assert await tm.get_token_async("us", client) == "fresh"
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_token_async_concurrent_callers_share_one_refresh():
+    tm = TokenManager("id", "secret")
+    requests: list[httpx.Request] = []
+    async with httpx.AsyncClient(transport=_counting_transport(requests)) as client:
+        tokens = await asyncio.gather(*(tm.get_token_async("us", client) for _ in range(10)))
+    assert set(tokens) == {"fresh"}
+    assert len(requests) == 1
+
+
+def test_get_token_returns_stale_token_while_another_thread_refreshes():
+    tm = TokenManager("id", "secret")
+    _stale(tm)
+    requests: list[httpx.Request] = []
+    with httpx.Client(transport=_counting_transport(requests)) as client:
+        with tm._lock:  # simulate a refresh in progress on another thread
+            assert tm.get_token("us", client) == "stale"
+        assert tm.get_token("us", client) == "fresh"
+    assert len(requests) == 1
+
+
+# ---------------------------------------------------------------------------
+# Process-wide sharing
+# ---------------------------------------------------------------------------
+
+
+def test_shared_returns_one_manager_per_credentials():
+    a = TokenManager.shared("shared-id", "secret")
+    assert TokenManager.shared("shared-id", "secret") is a
+    assert TokenManager.shared("shared-id", "other-secret") is not a
+    assert TokenManager.shared("other-id", "secret") is not a
+
+
+def test_shared_keeps_china_separate_from_global_regions():
+    us = TokenManager.shared("shared-id", "secret", region="us")
+    assert TokenManager.shared("shared-id", "secret", region="eu") is us  # same global OAuth host
+    assert TokenManager.shared("shared-id", "secret", region="cn") is not us
+
+
+def test_china_clients_do_not_share_a_token_with_global_clients():
+    from blizzardapi3 import BlizzardAPI
+
+    assert BlizzardAPI("shared-client", "secret", region="cn").token_manager is not (
+        BlizzardAPI("shared-client", "secret", region="us").token_manager
+    )
+
+
+def test_clear_shared_forgets_every_manager():
+    a = TokenManager.shared("shared-id", "secret")
+    TokenManager.clear_shared()
+    assert TokenManager.shared("shared-id", "secret") is not a
+
+
+def test_clients_with_same_credentials_share_token():
+    from blizzardapi3 import BlizzardAPI
+
+    first = BlizzardAPI("shared-client", "secret")
+    first.token_manager._token = "reused"
+    first.token_manager._expires_at = time.time() + 10_000
+
+    second = BlizzardAPI("shared-client", "secret")
+    assert second.token_manager is first.token_manager
+    assert second.token_manager.is_valid() is True
+
+
+# ---------------------------------------------------------------------------
+# Authorization code exchange
+# ---------------------------------------------------------------------------
+
+
+def test_exchange_authorization_code_posts_code_grant():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"access_token": "user-token", "expires_in": 86400, "scope": "wow.profile"})
+
+    tm = TokenManager("id", "secret")
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        data = tm.exchange_authorization_code("the-code", "https://example.com/cb", "eu", client)
+
+    assert data["access_token"] == "user-token"
+    assert str(seen[0].url) == "https://eu.battle.net/oauth/token"
+    assert seen[0].content == b"grant_type=authorization_code&code=the-code&redirect_uri=https%3A%2F%2Fexample.com%2Fcb"
+    assert tm.is_valid() is False  # the user token is not the app token
+
+
+@pytest.mark.asyncio
+async def test_exchange_authorization_code_async_raises_on_non_200():
+    tm = TokenManager("id", "secret")
+    transport = _mock_transport(400, {"error": "invalid_grant"})
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(TokenError) as exc_info:
+            await tm.exchange_authorization_code_async("bad", "https://example.com/cb", "us", client)
+    assert exc_info.value.response_data == {"error": "invalid_grant"}
+
+
+# ---------------------------------------------------------------------------
+# On-disk token cache
+# ---------------------------------------------------------------------------
+
+
+def test_disk_cache_reuses_token_across_managers(tmp_path):
+    calls: list[httpx.Request] = []
+    with httpx.Client(transport=_counting_transport(calls)) as client:
+        assert TokenManager("id", "secret", cache_dir=tmp_path).get_token("us", client) == "fresh"
+        # A new manager stands in for the next process run.
+        assert TokenManager("id", "secret", cache_dir=tmp_path).get_token("us", client) == "fresh"
+
+    assert len(calls) == 1
+    (cache_file,) = tmp_path.iterdir()
+    assert cache_file.name == f"token_{hashlib.sha256(b'id').hexdigest()[:32]}.json"  # hashed, not the raw id
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_disk_cache_ignores_expired_and_corrupt_files(tmp_path):
+    calls: list[httpx.Request] = []
+    tm = TokenManager("id", "secret", cache_dir=tmp_path)
+    tm._cache_file.write_text('{"access_token": "old", "expires_at": 0}')
+    with httpx.Client(transport=_counting_transport(calls)) as client:
+        assert tm.get_token("us", client) == "fresh"
+
+        tm2 = TokenManager("id", "secret", cache_dir=tmp_path)
+        tm2._cache_file.write_text("not json")
+        assert tm2.get_token("us", client) == "fresh"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_async_path(tmp_path):
+    calls: list[httpx.Request] = []
+    async with httpx.AsyncClient(transport=_counting_transport(calls)) as client:
+        await TokenManager("id", "secret", cache_dir=tmp_path).get_token_async("us", client)
+        assert await TokenManager("id", "secret", cache_dir=tmp_path).get_token_async("us", client) == "fresh"
+    assert len(calls) == 1
+
+
+def test_disk_cache_file_for_china_is_separate(tmp_path):
+    digest = hashlib.sha256(b"id").hexdigest()[:32]
+    assert TokenManager("id", "secret", cache_dir=tmp_path)._cache_file.name == f"token_{digest}.json"
+    assert TokenManager("id", "secret", tmp_path, region="cn")._cache_file.name == f"token_{digest}_cn.json"
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_async_io_runs_off_the_event_loop(tmp_path, mocker):
+    to_thread = mocker.spy(asyncio, "to_thread")
+    calls: list[httpx.Request] = []
+    async with httpx.AsyncClient(transport=_counting_transport(calls)) as client:
+        tm = TokenManager("id", "secret", cache_dir=tmp_path)
+        assert await tm.get_token_async("us", client) == "fresh"
+
+    assert [c.args[0] for c in to_thread.call_args_list] == [tm._load_cached, tm._save]
+    assert tm._cache_file.exists()
@@ -96,6 +96,47 @@ def test_lru_eviction_respects_max_entries():
     assert cache.get("us", "/a2", {}) is not None
 
 
+def _expire(cache: ResponseCache, key) -> None:
+    response, _ = cache._store[key]
+    cache._store[key] = (response, _time.monotonic() - 1)
+
+
+def test_stale_entry_with_validator_offers_conditional_headers():
+    cache = ResponseCache()
+    headers = {"cache-control": "max-age=1", "etag": '"abc"', "last-modified": "Tue, 01 Jul 2025 00:00:00 GMT"}
+    cache.store("us", "/a", {}, _resp({"id": 6}, headers))
+    _expire(cache, _make_key("us", "/a", {}))
+
+    assert cache.get("us", "/a", {}) is None
+    assert cache.conditional_headers("us", "/a", {}) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 01 Jul 2025 00:00:00 GMT",
+    }
+
+
+def test_validator_only_response_is_kept_but_never_fresh():
+    cache = ResponseCache()
+    cache.store("us", "/profile", {}, _resp({"name": "Beyloc"}, {"etag": '"v1"'}))
+    assert cache.get("us", "/profile", {}) is None
+    assert cache.conditional_headers("us", "/profile", {}) == {"If-None-Match": '"v1"'}
+
+
+def test_no_store_response_with_validator_is_not_kept():
+    cache = ResponseCache()
+    cache.store("us", "/a", {}, _resp({"id": 6}, {"cache-control": "no-store", "etag": '"v1"'}))
+    assert cache.conditional_headers("us", "/a", {}) == {}
+
+
+def test_revalidate_rearms_entry_from_304_headers():
+    cache = ResponseCache()
+    cache.store("us", "/a", {}, _resp({"id": 6}, {"cache-control": "max-age=1", "etag": '"v1"'}))
+    _expire(cache, _make_key("us", "/a", {}))
+
+    revalidated = cache.revalidate("us", "/a", {}, {"cache-control": "max-age=100"})
+    assert revalidated is not None and revalidated["id"] == 6
+    assert cache.get("us", "/a", {}) is revalidated
+
+
 # ---------------------------------------------------------------------------
 # Executor integration
 # ---------------------------------------------------------------------------
@@ -135,6 +176,53 @@ def test_response_without_cache_control_is_refetched():
     assert len(calls) == 2  # uncacheable, so two real calls
 
 
+def test_stale_entry_is_revalidated_with_conditional_get():
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"', "cache-control": "max-age=100"})
+        return httpx.Response(200, json={"id": 6}, headers={"etag": '"v1"'})
+
+    cache = ResponseCache()
+    executor = RequestExecutor(_token_manager(), cache=cache)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        first = executor.execute(region="us", path="/data/wow/achievement/6", params={"locale": "en_US"}, client=client)
+        second = executor.execute(
+            region="us", path="/data/wow/achievement/6", params={"locale": "en_US"}, client=client
+        )
+        third = executor.execute(region="us", path="/data/wow/achievement/6", params={"locale": "en_US"}, client=client)
+
+    assert first is second is third
+    assert second.status_code == 200
+    # Full fetch, then a 304 that re-armed the entry for max-age=100.
+    assert len(calls) == 2
+    assert "if-none-match" not in calls[0].headers
+
+
+@pytest.mark.asyncio
+async def test_async_stale_entry_is_revalidated_with_conditional_get():
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("if-modified-since"):
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": 42}, headers={"last-modified": "Tue, 01 Jul 2025 00:00:00 GMT"})
+
+    executor = RequestExecutor(_token_manager(), cache=ResponseCache())
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        for _ in range(3):
+            result = await executor.execute_async(
+                region="us", path="/data/wow/achievement/42", params={"locale": "en_US"}, client=client
+            )
+
+    assert result["id"] == 42
+    # Never fresh (no Cache-Control), so every repeat is a conditional GET answered by 304.
+    assert [r.headers.get("if-modified-since") is not None for r in calls] == [False, True, True]
+
+
 def test_user_token_request_bypasses_cache():
     calls: list[httpx.Request] = []
 
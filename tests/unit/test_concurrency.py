@@ -0,0 +1,185 @@
+"""Unit tests for the client-wide concurrency limiters — cap, cancellation, loop reuse, AIMD, executor wiring."""
+
+from __future__ import annotations
+
+import asyncio
+import time as _time
+
+import httpx
+import pytest
+
+from blizzardapi3.core.auth import TokenManager
+from blizzardapi3.core.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimiter
+from blizzardapi3.core.executor import RequestExecutor
+from blizzardapi3.exceptions import RateLimitError
+
+
+def _token_manager() -> TokenManager:
+    tm = TokenManager("id", "secret")
+    tm._token = "cached"
+    tm._expires_at = _time.time() + 10_000
+    return tm
+
+
+async def _hold(limiter: ConcurrencyLimiter, peak: list[int]) -> None:
+    async with limiter:
+        peak[0] = max(peak[0], limiter.in_flight)
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight():
+    limiter = ConcurrencyLimiter(3)
+    peak = [0]
+    await asyncio.gather(*(_hold(limiter, peak) for _ in range(12)))
+    assert peak[0] == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)  # slot is still available
+
+
+@pytest.mark.asyncio
+async def test_raising_the_limit_admits_waiters():
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.set_limit(2)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 2
+
+
+def test_limiter_survives_across_event_loops():
+    limiter = ConcurrencyLimiter(2)
+    for _ in range(2):
+        peak = [0]
+
+        async def run() -> None:
+            await asyncio.gather(*(_hold(limiter, peak) for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak[0] == 2
+
+
+def test_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(0)
+
+
+def test_adaptive_limit_grows_after_a_run_of_successes():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, ceiling=3, increase_after=2)
+    for expected in [2, 3, 3, 3, 3, 3]:
+        limiter.record(200, 0.0, 0.1)
+        assert limiter.limit == expected  # +1 every 2 successes, capped at the ceiling
+
+
+def test_adaptive_limit_halves_on_429_and_resets_the_streak():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, increase_after=2)
+    limiter.record(200, 0.0, 0.1)
+    limiter.record(429, 1.0, 1.1)
+    assert limiter.limit == 4
+    limiter.record(200, 2.0, 2.1)
+    assert limiter.limit == 4  # streak restarted after the 429
+
+
+def test_adaptive_limit_halves_once_for_a_burst_of_429s():
+    limiter = AdaptiveConcurrencyLimiter(initial=16)
+    for i in range(16):  # all sent together, answered 429 one after another
+        limiter.record(429, 0.0, 1.0 + i / 100)
+    assert limiter.limit == 8
+
+    limiter.record(429, 2.0, 2.1)
+    assert limiter.limit == 4  # sent after the cut, so it halves again
+
+
+def test_adaptive_limit_keeps_halving_under_sustained_429s():
+    limiter = AdaptiveConcurrencyLimiter(initial=16)
+    for i in range(1000):  # each request sent after the previous one was rejected
+        limiter.record(429, float(i), i + 0.5)
+    assert limiter.limit == 1
+
+
+def test_adaptive_limiter_tracks_latency_ewma():
+    limiter = AdaptiveConcurrencyLimiter()
+    limiter.record(200, 0.0, 1.0)
+    assert limiter.latency == 1.0
+    limiter.record(200, 0.0, 2.0)
+    assert limiter.latency == pytest.approx(1.2)
+
+
+@pytest.mark.asyncio
+async def test_executor_feeds_the_adaptive_limiter():
+    statuses = iter([429, 200, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"ok": True}, headers={"Retry-After": "0"})
+
+    limiter = AdaptiveConcurrencyLimiter(initial=4, increase_after=2)
+    executor = RequestExecutor(_token_manager(), concurrency=limiter)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await executor.execute_async(region="us", path="/data/wow/item/1", params={}, client=client)
+        await executor.execute_async(region="us", path="/data/wow/item/2", params={}, client=client)
+
+    assert limiter.limit == 3  # halved by the 429, then +1 after two successes
+    assert limiter.latency is not None
+
+
+@pytest.mark.asyncio
+async def test_executor_halves_once_when_in_flight_requests_all_get_429():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)  # keep all eight on the wire together
+        return httpx.Response(429, json={"error": "slow down"})
+
+    limiter = AdaptiveConcurrencyLimiter(initial=8)
+    executor = RequestExecutor(_token_manager(), concurrency=limiter, max_retries=0)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        results = await asyncio.gather(
+            *(
+                executor.execute_async(region="us", path=f"/data/wow/item/{i}", params={}, client=client)
+                for i in range(8)
+            ),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, RateLimitError) for r in results)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_executor_bounds_concurrent_requests():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    executor = RequestExecutor(_token_manager(), concurrency=ConcurrencyLimiter(4))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await asyncio.gather(
+            *(
+                executor.execute_async(region="us", path=f"/data/wow/item/{i}", params={}, client=client)
+                for i in range(20)
+            )
+        )
+
+    assert peak == 4
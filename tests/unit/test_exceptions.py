@@ -1,5 +1,9 @@
 """Tests for exception hierarchy."""
 
+import dataclasses
+
+import pytest
+
 from blizzardapi3.exceptions import (
     BadRequestError,
     BlizzardAPIError,
@@ -28,63 +32,67 @@ def test_not_found_error():
     assert error.status_code == 404
 
 
-def test_rate_limit_error():
-    """Test RateLimitError with retry_after."""
-    error = RateLimitError("Rate limited", status_code=429, retry_after=60)
-    assert "Retry after 60 seconds" in str(error)
-    assert error.is_rate_limited is True
-    assert error.should_retry is True
-
-
-def test_server_error():
-    """Test ServerError."""
-    error = ServerError("Internal server error", status_code=500)
-    assert error.should_retry is True
-
-
-def test_token_error():
-    """Test TokenError."""
-    error = TokenError("Invalid token", token_type="bearer", expires_in=3600)
-    assert "Token Type: bearer" in str(error)
-
-
-def test_validation_error_with_field():
-    """Test ValidationError with field information."""
-    error = MissingParameterError(
-        "Missing region", field="region", required_params=["region", "locale", "achievement_id"]
-    )
-    assert "region" in str(error)
-    assert "Required:" in str(error)
-
-
-def test_invalid_region_error():
-    """Test InvalidRegionError."""
-    error = InvalidRegionError("Invalid region", field="region", invalid_value="usa", valid_regions=["us", "eu", "kr"])
-    assert "us, eu, kr" in str(error)
-
-
-def test_invalid_locale_error():
-    """Test InvalidLocaleError."""
-    error = InvalidLocaleError(
-        "Invalid locale", field="locale", invalid_value="en-US", valid_locales=["en_US", "es_MX"]
-    )
-    assert "en_US, es_MX" in str(error)
-
-
-def test_request_error_retry_logic():
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (RateLimitError("Rate limited", status_code=429, retry_after=60), ["Retry after 60 seconds"]),
+        (TokenError("Invalid token", token_type="bearer", expires_in=3600), ["Token Type: bearer"]),
+        (
+            MissingParameterError(
+                "Missing region", field="region", required_params=["region", "locale", "achievement_id"]
+            ),
+            ["region", "Required:"],
+        ),
+        (
+            InvalidRegionError("Invalid region", field="region", invalid_value="usa", valid_regions=["us", "eu", "kr"]),
+            ["us, eu, kr"],
+        ),
+        (
+            InvalidLocaleError(
+                "Invalid locale", field="locale", invalid_value="en-US", valid_locales=["en_US", "es_MX"]
+            ),
+            ["en_US, es_MX"],
+        ),
+    ],
+    ids=["rate-limit", "token", "missing-param", "invalid-region", "invalid-locale"],
+)
+def test_message_includes_details(error: BlizzardAPIError, expected: list[str]):
+    """Test that each subclass renders its extra fields into the message."""
+    message = str(error)
+    for part in expected:
+        assert part in message
+
+
+@pytest.mark.parametrize(
+    "error, should_retry",
+    [
+        (RateLimitError("Rate limited", status_code=429), True),
+        (ServerError("Internal server error", status_code=500), True),
+        (ServerError("Server error", status_code=503), True),
+        (NotFoundError("Not found", status_code=404), False),
+        (BadRequestError("Bad request", status_code=400), False),
+    ],
+    ids=["429", "500", "503", "404", "400"],
+)
+def test_request_error_retry_logic(error: BlizzardAPIError, should_retry: bool):
     """Test RequestError retry logic."""
-    # Rate limit should retry
-    rate_limit = RateLimitError("Rate limited", status_code=429)
-    assert rate_limit.should_retry is True
-
-    # Server errors should retry
-    server_error = ServerError("Server error", status_code=503)
-    assert server_error.should_retry is True
-
-    # Not found should not retry
-    not_found = NotFoundError("Not found", status_code=404)
-    assert not_found.should_retry is False
-
-    # Bad request should not retry
-    bad_request = BadRequestError("Bad request", status_code=400)
-    assert bad_request.should_retry is False
+    assert error.should_retry is should_retry
+    assert error.is_rate_limited is (error.status_code == 429)
+
+
+def test_str_is_formatted_once_and_cached():
+    """Test that the formatted message is built once and reused."""
+    error = InvalidRegionError("Invalid region", field="region", invalid_value="usa", valid_regions=["us", "eu"])
+    first = str(error)
+    assert first == "ValidationError: Invalid region | Field: region | Invalid value: usa | Valid regions: us, eu"
+    assert str(error) is first
+    assert "_str" not in repr(error)
+
+
+def test_str_cache_is_not_a_dataclass_field():
+    """Test that the cached message stays out of fields() and asdict()."""
+    error = NotFoundError("Not found", status_code=404)
+    str(error)
+    assert "_str" not in {f.name for f in dataclasses.fields(error)}
+    assert "_str" not in dataclasses.asdict(error)
+    assert error == NotFoundError("Not found", status_code=404)
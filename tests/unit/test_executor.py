@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import json
+import pickle
+
 import httpx
 import pytest
 
+from blizzardapi3.core import executor as executor_module
 from blizzardapi3.core.auth import TokenManager
-from blizzardapi3.core.executor import ApiResponse, RequestExecutor
+from blizzardapi3.core.executor import ApiResponse, RequestExecutor, _target
 from blizzardapi3.exceptions import (
     BadRequestError,
     ForbiddenError,
@@ -57,6 +62,29 @@ def test_api_response_preserves_dict_access_and_metadata():
     assert resp.status_code == 200
 
 
+def test_api_response_has_no_instance_dict():
+    resp = ApiResponse({"id": 6}, {}, 200)
+    assert not hasattr(resp, "__dict__")
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_api_response_pickle_round_trip(protocol: int):
+    resp = ApiResponse({"id": 6, "name": "Level 10"}, {"X-Foo": "bar"}, 200)
+    restored = pickle.loads(pickle.dumps(resp, protocol=protocol))
+    assert type(restored) is ApiResponse
+    assert restored == resp
+    assert restored.headers == {"X-Foo": "bar"}
+    assert restored.status_code == 200
+
+
+def test_api_response_copy_keeps_metadata():
+    resp = ApiResponse({"id": 6}, {"X-Foo": "bar"}, 304)
+    for clone in (copy.copy(resp), copy.deepcopy(resp)):
+        assert clone == resp
+        assert clone.headers == {"X-Foo": "bar"}
+        assert clone.status_code == 304
+
+
 # ---------------------------------------------------------------------------
 # Sync success / retry paths
 # ---------------------------------------------------------------------------
@@ -193,6 +221,53 @@ def test_execute_rate_limit_preserves_retry_after():
     assert exc_info.value.retry_after == 30
 
 
+@pytest.mark.parametrize("value, expected", [("later", None), ("inf", None), ("1e400", None), ("9" * 400, 3600)])
+def test_execute_rate_limit_with_malformed_retry_after(value: str, expected: int | None):
+    tm = _token_manager_with()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": value}, json={"error": "rate limited"})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        executor = RequestExecutor(tm, max_retries=0)
+        with pytest.raises(RateLimitError) as exc_info:
+            executor.execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert exc_info.value.retry_after == expected
+
+
+def test_decode_uses_orjson_when_installed():
+    orjson = pytest.importorskip("orjson")
+    assert executor_module._loads is orjson.loads
+
+
+def test_decode_falls_back_to_stdlib_json(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(executor_module, "_loads", json.loads)
+    tm = _token_manager_with()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 6, "name": "Level 10"})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        result = RequestExecutor(tm).execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert result == {"id": 6, "name": "Level 10"}
+
+
+def test_execute_error_with_non_json_body_has_no_response_data():
+    tm = _token_manager_with()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, content=b"<html>Not Found</html>")
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        executor = RequestExecutor(tm, max_retries=0)
+        with pytest.raises(NotFoundError) as exc_info:
+            executor.execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert exc_info.value.response_data is None
+
+
 # ---------------------------------------------------------------------------
 # Async paths
 # ---------------------------------------------------------------------------
@@ -228,3 +303,23 @@ async def test_execute_async_translates_errors():
         executor = RequestExecutor(tm)
         with pytest.raises(NotFoundError):
             await executor.execute_async(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+
+# ---------------------------------------------------------------------------
+# Query string construction
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"namespace": "static-us", "locale": "en_US"},
+        {"namespace": "static-us", "locale": "en_US", "name.en_US": "wall street", "_page": 2, "flag": True},
+        {"locale": "en_US", "gameMode": "constructed"},
+        {"foo": "bar"},
+        {},
+    ],
+)
+def test_target_matches_httpx_encoding(params: dict):
+    url = "https://us.api.blizzard.com/data/wow/search/decor"
+    assert httpx.URL(_target(url, params)) == httpx.Request("GET", url, params=params).url
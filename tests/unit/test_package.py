@@ -0,0 +1,31 @@
+"""Tests for the package's lazy top-level exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import blizzardapi3
+
+
+def test_lazy_exports_resolve():
+    """Test every name in __all__ resolves, lazily loaded or not."""
+    for name in blizzardapi3.__all__:
+        assert getattr(blizzardapi3, name) is not None
+
+
+def test_unknown_attribute_raises():
+    """Test a missing name still raises AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'nope'"):
+        blizzardapi3.nope  # noqa: B018
+
+
+def test_types_import_does_not_load_client():
+    """Test importing types and exceptions leaves httpx unloaded."""
+    code = (
+        "import sys\n"
+        "from blizzardapi3 import NotFoundError, Region\n"
+        "assert 'httpx' not in sys.modules\n"
+        "assert 'blizzardapi3.blizzard_api' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
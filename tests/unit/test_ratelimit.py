@@ -0,0 +1,89 @@
+"""Unit tests for client-side rate limiting — bucket math, per-region isolation, executor wiring."""
+
+from __future__ import annotations
+
+import time as _time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from blizzardapi3.core.auth import TokenManager
+from blizzardapi3.core.cache import ResponseCache
+from blizzardapi3.core.executor import RequestExecutor
+from blizzardapi3.core.ratelimit import RateLimiter, TokenBucket
+
+
+def _token_manager() -> TokenManager:
+    tm = TokenManager("id", "secret")
+    tm._token = "cached"
+    tm._expires_at = _time.time() + 10_000
+    return tm
+
+
+# ---------------------------------------------------------------------------
+# TokenBucket / RateLimiter
+# ---------------------------------------------------------------------------
+
+
+def test_bucket_admits_burst_then_paces():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # Third request must wait ~1/rate; the fourth queues behind it.
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_hourly_quota_caps_sustained_rate():
+    limiter = RateLimiter(per_second=1000, per_hour=3)
+    delays = [limiter._reserve("us") for _ in range(4)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(3600 / 3, rel=0.01)
+
+
+def test_regions_have_independent_quotas():
+    limiter = RateLimiter(per_second=1, per_hour=100)
+    assert limiter._reserve("us") == 0.0
+    assert limiter._reserve("eu") == 0.0
+    assert limiter._reserve("us") > 0.0
+
+
+# ---------------------------------------------------------------------------
+# Executor integration
+# ---------------------------------------------------------------------------
+
+
+def test_executor_acquires_for_network_calls_only(mocker):
+    limiter = RateLimiter()
+    acquire = mocker.spy(limiter, "acquire")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 6}, headers={"cache-control": "max-age=100"})
+
+    executor = RequestExecutor(_token_manager(), cache=ResponseCache(), rate_limiter=limiter)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        for _ in range(3):
+            executor.execute(region="eu", path="/x", params={"locale": "en_GB"}, client=client)
+
+    acquire.assert_called_once_with("eu")  # repeats were cache hits
+
+
+@pytest.mark.asyncio
+async def test_executor_async_acquires_before_each_attempt(mocker):
+    mocker.patch("blizzardapi3.core.executor.asyncio.sleep", new_callable=AsyncMock)
+    limiter = RateLimiter()
+    acquire = mocker.spy(limiter, "acquire_async")
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503, json={"error": "down"})
+        return httpx.Response(200, json={"id": 42})
+
+    executor = RequestExecutor(_token_manager(), rate_limiter=limiter)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await executor.execute_async(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert acquire.await_count == 2  # first attempt + retry
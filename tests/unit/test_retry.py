@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import time as _time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
 from blizzardapi3.core.auth import TokenManager
+from blizzardapi3.core.cache import ResponseCache
 from blizzardapi3.core.executor import (
     BACKOFF_CAP,
+    RETRY_AFTER_CAP,
     RequestExecutor,
     _is_retryable,
     _retry_delay,
@@ -47,6 +51,29 @@ def test_retry_delay_honors_retry_after():
     assert _retry_delay(resp, 0) == 7.0
 
 
+def test_retry_delay_honors_http_date_retry_after():
+    when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    resp = httpx.Response(503, headers={"Retry-After": when})
+    assert 25.0 <= _retry_delay(resp, 0) <= 30.0
+
+
+@pytest.mark.parametrize("value", ["soon", "inf", "1e400", "nan", "-5", "1.5"])
+def test_retry_delay_ignores_malformed_retry_after(value: str):
+    resp = httpx.Response(503, headers={"Retry-After": value})
+    assert 0.0 <= _retry_delay(resp, 0) <= BACKOFF_CAP
+
+
+@pytest.mark.parametrize("value", ["99999", "9" * 5000])
+def test_retry_delay_caps_huge_retry_after(value: str):
+    resp = httpx.Response(429, headers={"Retry-After": value})
+    assert _retry_delay(resp, 0) == RETRY_AFTER_CAP
+
+
+def test_retry_delay_caps_far_future_http_date():
+    resp = httpx.Response(503, headers={"Retry-After": "Fri, 31 Dec 9999 23:59:59 GMT"})
+    assert _retry_delay(resp, 0) == RETRY_AFTER_CAP
+
+
 def test_retry_delay_backoff_stays_within_cap():
     resp = httpx.Response(503)
     for attempt in range(6):
@@ -110,6 +137,81 @@ def test_max_retries_zero_surfaces_immediately(mocker):
     sleep.assert_not_called()
 
 
+@pytest.mark.parametrize("value", ["inf", "1e400"])
+def test_non_finite_retry_after_falls_back_to_backoff(mocker, value: str):
+    sleep = mocker.patch("blizzardapi3.core.executor.time.sleep")
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": value}, json={"id": 6})
+
+    executor = RequestExecutor(_token_manager(), max_retries=2)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        resp = executor.execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert resp["id"] == 6
+    (delay,), _ = sleep.call_args
+    assert 0.0 <= delay <= BACKOFF_CAP
+
+
+def test_retries_connection_reset_then_succeeds(mocker):
+    sleep = mocker.patch("blizzardapi3.core.executor.time.sleep")
+    calls = _counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadError("connection reset by peer", request=request)
+        return httpx.Response(200, json={"id": 6})
+
+    executor = RequestExecutor(_token_manager(), max_retries=2)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        resp = executor.execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert resp["id"] == 6
+    assert len(calls) == 2
+    sleep.assert_called_once()
+
+
+def test_connection_errors_exhausted_reraise(mocker):
+    mocker.patch("blizzardapi3.core.executor.time.sleep")
+    calls = _counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    executor = RequestExecutor(_token_manager(), max_retries=2)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.ConnectError):
+            executor.execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert len(calls) == 3
+
+
+def test_resend_after_401_is_retried_on_connection_error(mocker):
+    sleep = mocker.patch("blizzardapi3.core.executor.time.sleep")
+    calls = _counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "battle.net" in str(request.url):
+            return httpx.Response(200, json={"access_token": "fresh", "expires_in": 86400})
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(401, json={"error": "unauthorized"})
+        if len(calls) == 2:
+            raise httpx.ReadError("connection reset by peer", request=request)
+        return httpx.Response(200, json={"id": 6})
+
+    executor = RequestExecutor(_token_manager(), max_retries=2)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        resp = executor.execute(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert resp["id"] == 6
+    assert [r.headers["authorization"] for r in calls] == ["Bearer cached", "Bearer fresh", "Bearer fresh"]
+    sleep.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Async retry behavior
 # ---------------------------------------------------------------------------
@@ -133,3 +235,48 @@ async def test_async_retries_503_then_succeeds(mocker):
     assert resp["id"] == 42
     assert len(calls) == 2
     sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_retries_timeout_then_succeeds(mocker):
+    sleep = mocker.patch("blizzardapi3.core.executor.asyncio.sleep", new_callable=AsyncMock)
+    calls = _counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={"id": 42})
+
+    executor = RequestExecutor(_token_manager(), max_retries=2)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        resp = await executor.execute_async(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert resp["id"] == 42
+    sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_refetch_after_304_eviction_is_retried_on_timeout(mocker):
+    sleep = mocker.patch("blizzardapi3.core.executor.asyncio.sleep", new_callable=AsyncMock)
+    calls = _counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("if-none-match"):
+            return httpx.Response(304)
+        if len(calls) == 3:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={"id": 42}, headers={"etag": '"v1"'})
+
+    cache = ResponseCache()
+    executor = RequestExecutor(_token_manager(), cache=cache, max_retries=2)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await executor.execute_async(region="us", path="/x", params={"locale": "en_US"}, client=client)
+        # The entry disappears while the conditional request is in flight.
+        mocker.patch.object(cache, "revalidate", return_value=None)
+        resp = await executor.execute_async(region="us", path="/x", params={"locale": "en_US"}, client=client)
+
+    assert resp["id"] == 42
+    assert [r.headers.get("if-none-match") for r in calls] == [None, '"v1"', None, None]
+    sleep.assert_awaited_once()
@@ -0,0 +1,157 @@
+"""Unit tests for request coalescing — shared results, shared errors, executor wiring."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time as _time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from blizzardapi3.core.auth import TokenManager
+from blizzardapi3.core.executor import RequestExecutor
+from blizzardapi3.core.singleflight import SingleFlight
+
+
+def _token_manager() -> TokenManager:
+    tm = TokenManager("id", "secret")
+    tm._token = "cached"
+    tm._expires_at = _time.time() + 10_000
+    return tm
+
+
+# ---------------------------------------------------------------------------
+# SingleFlight
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_do_async_runs_once_per_key_while_in_flight():
+    flight = SingleFlight()
+    calls: list[str] = []
+
+    async def fetch(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    results = await asyncio.gather(
+        *(flight.do_async(key, lambda key=key: fetch(key)) for key in ["a", "a", "b", "a", "b"])
+    )
+
+    assert results == ["A", "A", "B", "A", "B"]
+    assert sorted(calls) == ["a", "b"]
+    assert flight._tasks == {}  # forgotten once settled
+
+
+@pytest.mark.asyncio
+async def test_do_async_shares_exception_and_allows_retry():
+    flight = SingleFlight()
+    calls = 0
+
+    async def boom() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("kaboom")
+
+    results = await asyncio.gather(*(flight.do_async("k", boom) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert calls == 1
+
+    # Settled calls are not remembered — the next caller tries again.
+    with pytest.raises(ValueError):
+        await flight.do_async("k", boom)
+    assert calls == 2
+
+
+class _LookupCounter(dict):
+    """Stands in for ``SingleFlight._calls``; sets ``all_joined`` once ``n`` callers have looked up a key."""
+
+    def __init__(self, n: int) -> None:
+        super().__init__()
+        self._remaining = n
+        self.all_joined = threading.Event()
+
+    def get(self, key, default=None):
+        self._remaining -= 1  # called under SingleFlight's lock
+        if self._remaining == 0:
+            self.all_joined.set()
+        return super().get(key, default)
+
+
+def test_do_coalesces_concurrent_threads():
+    flight = SingleFlight()
+    flight._calls = lookups = _LookupCounter(4)
+    calls = 0
+
+    def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        # Hold the call open until every thread has found it in flight, however late it was scheduled.
+        assert lookups.all_joined.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flight.do, "k", fetch) for _ in range(4)]
+        results = [f.result() for f in futures]
+
+    assert results == [42, 42, 42, 42]
+    assert calls == 1
+
+
+# ---------------------------------------------------------------------------
+# Executor integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_executor_coalesces_identical_concurrent_requests():
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": int(request.url.path.rsplit("/", 1)[1])})
+
+    executor = RequestExecutor(_token_manager())
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        results = await asyncio.gather(
+            *(
+                executor.execute_async(
+                    region="us", path=f"/data/wow/achievement/{i}", params={"locale": "en_US"}, client=client
+                )
+                for i in [6, 6, 6, 7]
+            )
+        )
+
+    assert [r["id"] for r in results] == [6, 6, 6, 7]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_executor_does_not_coalesce_user_token_requests():
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"wow_accounts": []})
+
+    executor = RequestExecutor(_token_manager())
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await asyncio.gather(
+            *(
+                executor.execute_async(
+                    region="us",
+                    path="/profile/user/wow",
+                    params={"locale": "en_US", "access_token": token},
+                    client=client,
+                )
+                for token in ["alice", "bob"]
+            )
+        )
+
+    assert sorted(r.headers["authorization"] for r in calls) == ["Bearer alice", "Bearer bob"]
@@ -0,0 +1,234 @@
+"""Unit tests for streaming search results — incremental decoding, early exit, errors, executor wiring."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time as _time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from blizzardapi3.core.auth import TokenManager
+from blizzardapi3.core.concurrency import ConcurrencyLimiter
+from blizzardapi3.core.executor import RequestExecutor
+from blizzardapi3.exceptions import NotFoundError
+
+pytest.importorskip("ijson")
+
+from blizzardapi3.core.stream import aiter_items, iter_items  # noqa: E402
+
+PAGE = {"page": 1, "pageCount": 1, "results": [{"data": {"id": i, "weight": i / 2}} for i in range(50)]}
+BODY = json.dumps(PAGE).encode()
+
+
+def _token_manager() -> TokenManager:
+    tm = TokenManager("id", "secret")
+    tm._token = "cached"
+    tm._expires_at = _time.time() + 10_000
+    return tm
+
+
+def _chunks(size: int = 64):
+    for i in range(0, len(BODY), size):
+        yield BODY[i : i + size]
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+def test_iter_items_yields_every_result_across_chunk_boundaries():
+    assert list(iter_items(_chunks(), "results.item")) == PAGE["results"]
+
+
+def test_iter_items_is_lazy():
+    consumed = 0
+
+    def counting():
+        nonlocal consumed
+        for chunk in _chunks():
+            consumed += 1
+            yield chunk
+
+    items = iter_items(counting(), "results.item")
+    assert next(items)["data"]["id"] == 0
+    assert consumed < len(BODY) // 64  # stopped long before the end of the body
+
+
+@pytest.mark.asyncio
+async def test_aiter_items_matches_sync():
+    async def chunks():
+        for chunk in _chunks():
+            yield chunk
+
+    assert [item async for item in aiter_items(chunks(), "results.item")] == PAGE["results"]
+
+
+# ---------------------------------------------------------------------------
+# Executor integration
+# ---------------------------------------------------------------------------
+
+
+def test_executor_stream_yields_results():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"] == "Bearer cached"
+        return httpx.Response(200, content=BODY)
+
+    executor = RequestExecutor(_token_manager())
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        items = list(executor.stream(region="us", path="/data/wow/search/decor", params={}, client=client))
+
+    assert [item["data"]["id"] for item in items] == list(range(50))
+
+
+def test_executor_stream_raises_before_first_item():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+    executor = RequestExecutor(_token_manager(), max_retries=0)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(NotFoundError):
+            next(executor.stream(region="us", path="/data/wow/search/decor", params={}, client=client))
+
+
+def test_executor_stream_refreshes_token_on_401(mocker):
+    tm = _token_manager()
+    mocker.patch.object(tm, "get_token", side_effect=["stale", "fresh"])
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["authorization"])
+        return httpx.Response(401 if len(seen) == 1 else 200, content=BODY)
+
+    executor = RequestExecutor(tm, max_retries=0)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        items = list(executor.stream(region="us", path="/data/wow/search/decor", params={}, client=client))
+
+    assert seen == ["Bearer stale", "Bearer fresh"]
+    assert len(items) == 50
+
+
+def test_executor_stream_retries_connection_reset_on_open(mocker):
+    sleep = mocker.patch("blizzardapi3.core.executor.time.sleep")
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadError("connection reset by peer", request=request)
+        return httpx.Response(200, content=BODY)
+
+    executor = RequestExecutor(_token_manager(), max_retries=2)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        items = list(executor.stream(region="us", path="/data/wow/search/decor", params={}, client=client))
+
+    assert len(items) == 50
+    assert len(calls) == 2
+    sleep.assert_called_once()
+
+
+def test_executor_stream_without_ijson_fails_before_sending(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "ijson", None)  # makes `import ijson` raise ImportError
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, content=BODY)
+
+    executor = RequestExecutor(_token_manager())
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(ImportError, match=r"blizzardapi3\[stream\]"):
+            next(executor.stream(region="us", path="/data/wow/search/decor", params={}, client=client))
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_executor_stream_async_without_ijson_fails_before_sending(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, content=BODY)
+
+    executor = RequestExecutor(_token_manager())
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(ImportError, match=r"blizzardapi3\[stream\]"):
+            await anext(executor.stream_async(region="us", path="/data/wow/search/decor", params={}, client=client))
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_executor_stream_async_retries_timeout_on_open(mocker):
+    sleep = mocker.patch("blizzardapi3.core.executor.asyncio.sleep", new_callable=AsyncMock)
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, content=BODY)
+
+    limiter = ConcurrencyLimiter(1)
+    executor = RequestExecutor(_token_manager(), concurrency=limiter, max_retries=2)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        items = [
+            item
+            async for item in executor.stream_async(
+                region="us", path="/data/wow/search/decor", params={}, client=client
+            )
+        ]
+
+    assert len(items) == 50
+    assert len(calls) == 2
+    sleep.assert_awaited_once()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_stream_async_retries_then_yields():
+    statuses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), content=BODY, headers={"Retry-After": "0"})
+
+    executor = RequestExecutor(_token_manager())
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        items = [
+            item
+            async for item in executor.stream_async(
+                region="us", path="/data/wow/search/decor", params={}, client=client
+            )
+        ]
+
+    assert len(items) == 50
+
+
+@pytest.mark.asyncio
+async def test_executor_stream_async_releases_slot_before_yielding():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search/mount"):
+            return httpx.Response(200, content=BODY)
+        return httpx.Response(200, json={"id": 1})
+
+    limiter = ConcurrencyLimiter(1)
+    executor = RequestExecutor(_token_manager(), concurrency=limiter)
+
+    async def consume() -> int:
+        nested = 0
+        async for _ in executor.stream_async(region="us", path="/data/wow/search/mount", params={}, client=client):
+            # A nested call needs the only slot — it must not be held by the stream.
+            await executor.execute_async(region="us", path=f"/data/wow/mount/{nested}", params={}, client=client)
+            nested += 1
+        return nested
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert await asyncio.wait_for(consume(), timeout=2) == 50
+
+    assert limiter.in_flight == 0
@@ -2,7 +2,7 @@
 
 import pytest
 
-from blizzardapi3.types import Locale, Region, get_default_locale
+from blizzardapi3.types import LOCALE_VALUES, REGION_VALUES, Locale, Region, get_default_locale
 
 
 def test_region_enum():
@@ -50,3 +50,11 @@ def test_invalid_region_raises_error():
     """Test that invalid region raises ValueError."""
     with pytest.raises(ValueError, match="Invalid region"):
         get_default_locale("invalid")
+
+
+def test_value_sets_match_enums():
+    """Test the frozenset lookups cover exactly the enum values."""
+    assert REGION_VALUES == {r.value for r in Region}
+    assert LOCALE_VALUES == {loc.value for loc in Locale}
+    assert "us" in REGION_VALUES
+    assert "xx" not in REGION_VALUES